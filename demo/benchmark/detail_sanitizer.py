@@ -0,0 +1,69 @@
+import argparse
+import re
+import time
+from fixtures import load_responses
+from parsing import parse_html, sanitize_detail
+
+
+def legacy_sanitize(soup):
+    """단일 순회 도입 전의 여러 번 순회하던 정리 로직 (비교용)"""
+    for element in soup(["script", "style", "noscript"]):
+        element.extract()
+
+    images = [f'https:{img.get("src")}' if img.get("src").startswith("//") else img.get("src") for img in soup.find_all('img') if img.get("src")]
+
+    for tag in soup.find_all('p', attrs={'hidden': True}):
+        tag.decompose()
+
+    hidden_style_pattern = re.compile(r'(font-size:\s*0|height:\s*0|width:\s*0|display:\s*none|visibility:\s*hidden)', re.IGNORECASE)
+    for tag in soup.find_all(attrs={"style": hidden_style_pattern}):
+        tag.decompose()
+
+    for tag in soup.find_all(class_=re.compile(r'(blind|hidden|sr-only)')):
+        tag.decompose()
+
+    return soup, soup.get_text(separator=' ', strip=True), images
+
+
+def measure(sanitize, documents, repeat):
+    # 파싱 시간은 빼고 정리 단계만 잰다
+    elapsed = 0.0
+    for _ in range(repeat):
+        soups = [parse_html(content, encoding) for content, encoding in documents]
+        started = time.perf_counter()
+        for soup in soups:
+            sanitize(soup)
+        elapsed += time.perf_counter() - started
+    return elapsed / (repeat * len(documents)) * 1000
+
+
+def run(cassette_dir, repeat):
+    cases = [
+        ("saramin.detail", load_responses(cassette_dir, "Saramin", "/zf_user/jobs/relay/view-detail")),
+        ("jobkorea.detail", load_responses(cassette_dir, "Jobkorea", "GIReadDetailContentIframe")),
+    ]
+    for name, responses in cases:
+        if not responses:
+            print(f"[{name}] 카세트에 응답이 없습니다. (HTTP_CASSETTE_MODE=record 로 먼저 기록)")
+            continue
+
+        documents = [(r.content, r.charset_encoding) for r in responses]
+        mismatches = 0
+        for content, encoding in documents:
+            old_soup, old_text, old_images = legacy_sanitize(parse_html(content, encoding))
+            new_soup, new_text, new_images = sanitize_detail(parse_html(content, encoding))
+            if (old_text, old_images, str(old_soup)) != (new_text, new_images, str(new_soup)):
+                mismatches += 1
+
+        legacy = measure(legacy_sanitize, documents, repeat)
+        single = measure(sanitize_detail, documents, repeat)
+        print(f"[{name}] 기존 {legacy:7.2f} ms/doc | 단일 순회 {single:7.2f} ms/doc | x{legacy / single:4.2f} | "
+              f"불일치 {mismatches}/{len(documents)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="상세 본문 정리 로직의 기존 방식 대비 결과 일치 여부와 처리 시간 비교")
+    parser.add_argument("--cassettes", default="cassettes")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.cassettes, args.repeat)
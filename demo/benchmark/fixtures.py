@@ -0,0 +1,32 @@
+import base64
+import gzip
+import json
+import os
+import sys
+import httpx
+
+MAIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "main"))
+if MAIN_DIR not in sys.path:
+    sys.path.insert(0, MAIN_DIR)
+
+
+def load_responses(cassette_dir, platform, url_pattern, method=None):
+    """HTTP_CASSETTE_MODE=record로 기록한 카세트에서 URL이 일치하는 응답을 httpx.Response로 읽어온다."""
+    path = os.path.join(cassette_dir, f"{platform.lower()}.jsonl.gz")
+    if not os.path.exists(path):
+        return []
+
+    responses = []
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            record_method, url, _ = record["key"].split(" ", 2)
+            if url_pattern not in url or (method and record_method != method) or record["status"] != 200:
+                continue
+            responses.append(httpx.Response(
+                record["status"],
+                headers=record["headers"],
+                content=base64.b64decode(record["body"]),
+                request=httpx.Request(record_method, url),
+            ))
+    return responses
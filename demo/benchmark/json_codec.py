@@ -0,0 +1,47 @@
+import argparse
+import json
+import time
+from fixtures import load_responses
+from utils import json_codec
+
+
+def measure(fn, items, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            fn(item)
+    return (time.perf_counter() - started) / (repeat * len(items)) * 1_000_000
+
+
+def run(cassette_dir, repeat):
+    cases = [
+        ("wanted.list", load_responses(cassette_dir, "Wanted", "/api/chaos/navigation/v1/results")),
+        ("wanted.detail", load_responses(cassette_dir, "Wanted", "/api/chaos/jobs/v4")),
+        ("wanted.company", load_responses(cassette_dir, "Wanted", "insight.wanted.co.kr")),
+    ]
+    print(f"json_codec 백엔드: {json_codec.BACKEND}")
+    for name, responses in cases:
+        if not responses:
+            print(f"[{name}] 카세트에 응답이 없습니다. (HTTP_CASSETTE_MODE=record 로 먼저 기록)")
+            continue
+
+        bodies = [r.content for r in responses]
+        payloads = [json.loads(body) for body in bodies]
+        mismatches = sum(1 for body, payload in zip(bodies, payloads)
+                         if json_codec.loads(body) != payload or json_codec.loads(json_codec.dumps(payload)) != payload)
+
+        std_loads = measure(json.loads, bodies, repeat)
+        fast_loads = measure(json_codec.loads, bodies, repeat)
+        std_dumps = measure(lambda payload: json.dumps(payload, ensure_ascii=False), payloads, repeat)
+        fast_dumps = measure(json_codec.dumps, payloads, repeat)
+        print(f"[{name}] loads {std_loads:8.1f} → {fast_loads:8.1f} us/doc (x{std_loads / fast_loads:4.2f}) | "
+              f"dumps {std_dumps:8.1f} → {fast_dumps:8.1f} us/doc (x{std_dumps / fast_dumps:4.2f}) | "
+              f"불일치 {mismatches}/{len(bodies)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="원티드 응답으로 표준 json과 json_codec의 파싱/직렬화 시간 비교")
+    parser.add_argument("--cassettes", default="cassettes")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    run(args.cassettes, args.repeat)
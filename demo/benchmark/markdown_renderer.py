@@ -0,0 +1,48 @@
+import argparse
+import time
+from fixtures import load_responses
+from parsing import parse_html, render_markdown, sanitize_detail
+from parsing.markdown import new_converter
+
+
+def legacy_render(soup):
+    """직접 렌더링 도입 전 방식: 트리를 문자열로 직렬화한 뒤 html2text가 다시 파싱 (비교용)"""
+    return new_converter().handle(str(soup))
+
+
+def measure(render, soups, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for soup in soups:
+            render(soup)
+    return (time.perf_counter() - started) / (repeat * len(soups)) * 1000
+
+
+def run(cassette_dir, repeat):
+    cases = [
+        ("saramin.detail", load_responses(cassette_dir, "Saramin", "/zf_user/jobs/relay/view-detail")),
+        ("jobkorea.detail", load_responses(cassette_dir, "Jobkorea", "GIReadDetailContentIframe")),
+    ]
+    for name, responses in cases:
+        if not responses:
+            print(f"[{name}] 카세트에 응답이 없습니다. (HTTP_CASSETTE_MODE=record 로 먼저 기록)")
+            continue
+
+        # 크롤러와 같이 정리된 트리를 기준으로 비교한다
+        soups = [sanitize_detail(parse_html(r.content, r.charset_encoding))[0] for r in responses]
+        mismatches = [str(r.url) for r, soup in zip(responses, soups) if legacy_render(soup) != render_markdown(soup)]
+
+        legacy = measure(legacy_render, soups, repeat)
+        direct = measure(render_markdown, soups, repeat)
+        print(f"[{name}] html2text {legacy:7.2f} ms/doc | 직접 렌더링 {direct:7.2f} ms/doc | x{legacy / direct:4.2f} | "
+              f"불일치 {len(mismatches)}/{len(soups)}")
+        for url in mismatches:
+            print(f"  ⚠️ {url}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="직접 마크다운 렌더링과 html2text 결과 일치 여부 및 변환 시간 비교")
+    parser.add_argument("--cassettes", default="cassettes")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.cassettes, args.repeat)
@@ -0,0 +1,52 @@
+import argparse
+import logging
+import time
+from fixtures import load_responses
+from crawler.saramin_crawler import SaraminCrawler
+from crawler.jobkorea_crawler import JobkoreaCrawler
+from parsing import BACKENDS, set_default_backend
+
+
+def build_cases(cassette_dir):
+    logger = logging.getLogger("Benchmark")
+    saramin = SaraminCrawler(logger=logger)
+    jobkorea = JobkoreaCrawler(logger=logger)
+    return [
+        ("saramin.detail", lambda r: SaraminCrawler.parse_job_detail(r.content, r.charset_encoding, saramin.keyword),
+         load_responses(cassette_dir, "Saramin", "/zf_user/jobs/relay/view-detail")),
+        ("saramin.company", lambda r: SaraminCrawler.parse_company_info(r.content, r.charset_encoding, str(r.url)),
+         load_responses(cassette_dir, "Saramin", "company-info-view")),
+        ("jobkorea.detail", lambda r: JobkoreaCrawler.parse_job_detail(r.content, r.charset_encoding, jobkorea.keyword),
+         load_responses(cassette_dir, "Jobkorea", "GIReadDetailContentIframe")),
+    ]
+
+
+def run(cassette_dir, repeat):
+    for name, parse, responses in build_cases(cassette_dir):
+        if not responses:
+            print(f"[{name}] 카세트에 응답이 없습니다. (HTTP_CASSETTE_MODE=record 로 먼저 기록)")
+            continue
+
+        baseline = None
+        for backend in BACKENDS:
+            set_default_backend(backend)
+            results = [parse(response) for response in responses]
+            started = time.perf_counter()
+            for _ in range(repeat):
+                for response in responses:
+                    parse(response)
+            elapsed = (time.perf_counter() - started) / (repeat * len(responses)) * 1000
+
+            if baseline is None:
+                baseline, baseline_elapsed = results, elapsed
+            mismatches = sum(1 for a, b in zip(baseline, results) if a != b)
+            print(f"[{name}] {backend:<12} {elapsed:8.2f} ms/doc | x{baseline_elapsed / elapsed:4.2f} | "
+                  f"불일치 {mismatches}/{len(responses)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HTML 파서 백엔드별 추출 결과 일치 여부와 파싱 시간 비교")
+    parser.add_argument("--cassettes", default="cassettes")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.cassettes, args.repeat)
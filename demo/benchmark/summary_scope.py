@@ -0,0 +1,54 @@
+import argparse
+import time
+from fixtures import load_responses
+from crawler.saramin_crawler import SaraminCrawler
+from crawler.jobkorea_crawler import JobkoreaCrawler
+from parsing import set_scoped_parsing
+
+BASE_URL = "https://m.jobkorea.co.kr"
+
+
+def build_cases(cassette_dir):
+    return [
+        ("saramin.summary", lambda r: SaraminCrawler.parse_job_summary(r.content, r.charset_encoding, None),
+         load_responses(cassette_dir, "Saramin", "/job-search/view-card")),
+        ("jobkorea.summary", lambda r: JobkoreaCrawler.parse_summary_info(r.content, r.charset_encoding, BASE_URL),
+         load_responses(cassette_dir, "Jobkorea", "/Recruit/SwipeGIReadInfo")),
+        ("jobkorea.basic", lambda r: JobkoreaCrawler.parse_basic_info(r.content, r.charset_encoding),
+         load_responses(cassette_dir, "Jobkorea", "/Recruit/GI_Read")),
+    ]
+
+
+def measure(parse, responses, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for response in responses:
+            parse(response)
+    return (time.perf_counter() - started) / (repeat * len(responses)) * 1000
+
+
+def run(cassette_dir, repeat):
+    for name, parse, responses in build_cases(cassette_dir):
+        if not responses:
+            print(f"[{name}] 카세트에 응답이 없습니다. (HTTP_CASSETTE_MODE=record 로 먼저 기록)")
+            continue
+
+        set_scoped_parsing(False)
+        full_results = [parse(response) for response in responses]
+        full = measure(parse, responses, repeat)
+
+        set_scoped_parsing(True)
+        scoped_results = [parse(response) for response in responses]
+        scoped = measure(parse, responses, repeat)
+
+        mismatches = sum(1 for a, b in zip(full_results, scoped_results) if a != b)
+        print(f"[{name}] 전체 파싱 {full:7.2f} ms/doc | 섹션 파싱 {scoped:7.2f} ms/doc | x{full / scoped:4.2f} | "
+              f"불일치 {mismatches}/{len(responses)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="요약 페이지의 전체 파싱과 섹션 단위 파싱의 결과 일치 여부 및 파싱 시간 비교")
+    parser.add_argument("--cassettes", default="cassettes")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.cassettes, args.repeat)
@@ -12,7 +12,37 @@ class Setting:
     ORACLE_DSN = os.getenv("ORACLE_DSN")
     WALLET_DIR = os.getenv("WALLET_DIR")
     WALLET_PASSWORD = os.getenv("WALLET_PASSWORD")
+    # 지정하면 Oracle 대신 사용 (예: 카세트 재생용 sqlite:///offline.db)
+    DATABASE_URL = os.getenv("DATABASE_URL")
 
     # NOSQL settings
     COMPARTMENT_OCID = os.getenv("COMPARTMENT_OCID")
-    NOSQL_TABLE_NAME = os.getenv("NOSQL_TABLE_NAME")
\ No newline at end of file
+    NOSQL_TABLE_NAME = os.getenv("NOSQL_TABLE_NAME")
+
+    # Crawler settings
+    RATE_LIMIT_PER_SEC = float(os.getenv("RATE_LIMIT_PER_SEC", "3"))
+    RATE_LIMIT_BURST = int(os.getenv("RATE_LIMIT_BURST", "5"))
+    # html.parser / lxml / lexbor (selectolax)
+    HTML_PARSER_BACKEND = os.getenv("HTML_PARSER_BACKEND", "html.parser")
+    # 파싱용 프로세스 수 (auto: CPU 코어 수, 0: 이벤트 루프에서 직접 파싱)
+    PARSE_WORKERS = os.getenv("PARSE_WORKERS", "auto")
+    RESPONSE_MAX_BYTES = int(os.getenv("RESPONSE_MAX_BYTES", str(10 * 1024 * 1024)))
+    # 파이프라인 단계별 워커 수 (0이면 fetch는 크롤러 최대 동시성을 따른다)
+    PIPELINE_FETCH_WORKERS = int(os.getenv("PIPELINE_FETCH_WORKERS", "0"))
+    PIPELINE_PARSE_WORKERS = int(os.getenv("PIPELINE_PARSE_WORKERS", "8"))
+    # 한 번에 커밋/적재하는 최대 공고 수
+    PIPELINE_BATCH_SIZE = int(os.getenv("PIPELINE_BATCH_SIZE", "20"))
+    HTTP_CACHE_DIR = os.getenv("HTTP_CACHE_DIR")
+    HTTP_CACHE_TTL_DAYS = int(os.getenv("HTTP_CACHE_TTL_DAYS", "14"))
+    HTTP_CACHE_MAX_MB = int(os.getenv("HTTP_CACHE_MAX_MB", "200"))
+    # --resume용 플랫폼별 수집 체크포인트 저장 위치
+    CRAWL_CHECKPOINT_DIR = os.getenv("CRAWL_CHECKPOINT_DIR", ".crawl_checkpoint")
+    # 이보다 오래된 체크포인트는 지난 실행의 것으로 보고 --resume에서 무시 (하루 한 번 실행 기준)
+    CRAWL_CHECKPOINT_MAX_AGE_HOURS = float(os.getenv("CRAWL_CHECKPOINT_MAX_AGE_HOURS", "20"))
+    # 같은 공고를 이 횟수보다 많은 실행에서 연속으로 놓치면 더 이상 워터마크를 그 아래로 묶지 않는다
+    WATERMARK_HOLD_MAX_RUNS = int(os.getenv("WATERMARK_HOLD_MAX_RUNS", "3"))
+    # record: 실제 응답을 카세트에 기록 / replay: 카세트로만 응답 (오프라인)
+    HTTP_CASSETTE_MODE = os.getenv("HTTP_CASSETTE_MODE")
+    HTTP_CASSETTE_DIR = os.getenv("HTTP_CASSETTE_DIR", "cassettes")
+    # 초 단위 숫자 또는 "recorded" (기록 당시 응답 시간)
+    HTTP_REPLAY_LATENCY = os.getenv("HTTP_REPLAY_LATENCY", "0")
\ No newline at end of file
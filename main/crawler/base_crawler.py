@@ -1,10 +1,28 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional, Tuple
 import asyncio
+import inspect
+import os
+import time
 import httpx
+from config.setting import Setting
+from .concurrency import AdaptiveConcurrencyLimiter
+from .rate_limiter import HostRateLimiter
+from .retry import RetryExhaustedError, RetryPolicy
+from .http_client import ConnectionStats, ResponseTooLargeError, build_client, build_transport, read_capped
+from .cassette import Cassette, RecordingTransport, ReplayTransport
+from .http_cache import HttpCache
+from .single_flight import SingleFlight
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+from .hedging import HedgePolicy
+from .parse_pool import ParsePool
 
 class BaseCrawler(ABC):
-    def __init__(self, base_url, platform, logger, k=5):
+    # 파싱 로직이나 스키마를 바꾸면 올려서 HTTP 캐시에 남은 이전 파싱 결과를 쓰지 않게 한다
+    PARSER_VERSION = 1
+
+    def __init__(self, base_url, platform, logger, k=5, max_k=20, retry_policy=None,
+                 http2=True, keepalive_connections=None, keepalive_expiry=30.0):
         self.base_url = base_url
         self.platform = platform
         self.user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
@@ -13,61 +31,308 @@ class BaseCrawler(ABC):
         self.logger = logger
 
         self.client = None
-        self.semaphore = asyncio.Semaphore(k)
+        self.limiter = AdaptiveConcurrencyLimiter(platform, logger.getChild(platform), initial_limit=k, max_limit=max_k)
+        self.retry_policy = retry_policy or RetryPolicy()
+
+        self.http2 = http2
+        # 따로 정하지 않으면 동시성 상한만큼 유휴 연결을 유지한다
+        self.keepalive_connections = keepalive_connections or max_k
+        self.keepalive_expiry = keepalive_expiry
+        self.max_k = max_k
+        self.connection_stats = ConnectionStats()
+        self.cache = None
+        self.single_flight = SingleFlight()
+        self.breaker = CircuitBreaker(platform, logger.getChild(platform))
+        self.hedging = HedgePolicy()
+        # 엔드포인트별 응답 본문 상한 (넘으면 읽기를 중단하고 건너뜀)
+        self.max_body_bytes = {
+            "list": 2 * 1024 * 1024,
+            "summary": 1 * 1024 * 1024,
+            "detail": 5 * 1024 * 1024,
+            "company": 2 * 1024 * 1024,
+        }
+        self.replay = Setting.HTTP_CASSETTE_MODE == "replay"
 
-    async def request(self, method, url, **kwargs):
+    async def request(self, method, url, hedge=None, gone_statuses=None, **kwargs):
         if self.client is None:
             raise RuntimeError("Client Session is not initialized. Use 'async with' context.")
 
-        retries = 5
-        for attempt in range(1, retries + 1):
-            async with self.semaphore:
-                try:
-                    response = await self.client.request(method, url, **kwargs)
-                    if response.status_code in [302, 404, 503]:
-                        self.logger.warning(f"🚫 [Pass] 공고가 삭제되거나 검수 중입니다.\n"
-                                            f"(Request URL: {url})\n"
-                                            f"(Status Code: {response.status_code})\n"
-                                            f"(Location: {response.headers.get('Location')})")
-                        return None
-                        
-                    response.raise_for_status()
-                    return response
-                except (httpx.ConnectTimeout, httpx.ReadTimeout, httpx.RemoteProtocolError, httpx.ConnectError, httpx.ReadError) as e:
-                    if attempt == retries:
-                        self.logger.error(f"🔥 [최종 실패] {self.platform} | URL: {url}\n"
-                                          f"   ㄴ 에러: {e}\n"
-                                          f"   ㄴ 요청 데이터(Payload): {kwargs}")
+        policy = self.retry_policy
+        deadline = time.monotonic() + policy.deadline
+        for attempt in range(1, policy.max_attempts + 1):
+            retry_after = None
+            timeout = policy.attempt_timeout(kwargs.get("timeout") or self.client.timeout, deadline - time.monotonic())
+            send_kwargs = {**kwargs, "timeout": timeout, "gone_statuses": gone_statuses}
+            try:
+                # hedge는 멱등한 GET에만 건다
+                if hedge and method == "GET":
+                    response = await self._send_hedged(hedge, method, url, **send_kwargs)
+                else:
+                    response = await self._send(method, url, **send_kwargs)
+            except ResponseTooLargeError as e:
+                self.logger.warning(f"🚫 [Pass] {e}")
+                return None
+            except policy.RETRYABLE_EXCEPTIONS as e:
+                error, response = e, None
+            except httpx.RequestError as e:
+                self.logger.error(
+                    f"[요청 에러] {e.request.url!r} - {e}\n"
+                    f"   ㄴ 요청 데이터(Payload): {kwargs}"
+                )
+                raise
+
+            if response is not None:
+                if policy.is_gone_status(response.status_code, gone_statuses):
+                    self.logger.warning(f"🚫 [Pass] 공고가 삭제되거나 검수 중입니다.\n"
+                                        f"(Request URL: {url})\n"
+                                        f"(Status Code: {response.status_code})\n"
+                                        f"(Location: {response.headers.get('Location')})")
+                    return None
+                if not policy.is_retryable_status(response.status_code, gone_statuses):
+                    if response.status_code == 304:
+                        return response
+                    try:
+                        response.raise_for_status()
+                    except httpx.HTTPStatusError as e:
+                        self.logger.error(
+                            f"[상태 코드 에러] {e.response.status_code} - {e.request.url!r}\n"
+                            f"   ㄴ 요청 데이터(Payload): {kwargs}"
+                        )
                         raise
-                    wait_time = 2 ** attempt # 2초, 4초...
-                    self.logger.warning(f"⚠️ [재시도 {attempt}/{retries}] {self.platform} | 연결 지연 발생. {wait_time}초 후 재시도... ({e})"
-                                        f"   ㄴ 요청 URL: {url}")
-                    await asyncio.sleep(wait_time)
-                except httpx.RequestError as e:
-                    self.logger.error(
-                        f"[요청 에러] {e.request.url!r} - {e}\n"
-                        f"   ㄴ 요청 데이터(Payload): {kwargs}"
-                    )
-                    raise
-                except httpx.HTTPStatusError as e:
-                    self.logger.error(
-                        f"[상태 코드 에러] {e.response.status_code} - {e.request.url!r}\n"
-                        f"   ㄴ 요청 데이터(Payload): {kwargs}"
-                    )
-                    raise
-    
+                    return response
+                error = f"HTTP {response.status_code}"
+                retry_after = policy.parse_retry_after(response.headers.get("Retry-After"))
+
+            # 서킷이 열렸으면 남은 재시도를 버리고 즉시 실패한다
+            if self.breaker.state == CircuitBreaker.OPEN:
+                raise CircuitOpenError(self.platform, self.breaker.remaining())
+
+            # 백오프 대기는 동시성 슬롯을 반납한 상태에서 한다
+            wait_time = policy.backoff(attempt, retry_after)
+            # 대기 후 최소한의 시도 시간도 남지 않으면 바로 포기한다
+            if attempt == policy.max_attempts or time.monotonic() + wait_time + policy.min_attempt_timeout > deadline:
+                self.logger.error(f"🔥 [최종 실패] {self.platform} | URL: {url} ({attempt}회 시도)\n"
+                                  f"   ㄴ 에러: {error}\n"
+                                  f"   ㄴ 요청 데이터(Payload): {kwargs}")
+                # 삭제된 공고(None)와 구분되도록 원인과 상관없이 같은 예외로 올린다
+                raise RetryExhaustedError(self.platform, url, attempt, error) from (error if response is None else None)
+
+            self.logger.warning(f"⚠️ [재시도 {attempt}/{policy.max_attempts}] {self.platform} | {wait_time:.1f}초 후 재시도... ({error})\n"
+                                f"   ㄴ 요청 URL: {url}")
+            await asyncio.sleep(wait_time)
+
+    async def fetch_cached(self, url, parse, **kwargs):
+        # 같은 URL을 동시에 요청하면 네트워크 호출과 파싱 결과를 하나로 공유한다
+        key = HttpCache.make_key(url, kwargs.get("params"))
+        return await self.single_flight.do(key, lambda: self._fetch_cached(key, url, parse, **kwargs))
+
+    async def fetch_cached_response(self, url, **kwargs):
+        # 원본 응답이 필요한 곳(content_hash 등)은 파싱 없이 캐시·조건부 요청·중복 병합만 거친다
+        return await self.fetch_cached(url, None, **kwargs)
+
+    async def _fetch_cached(self, key, url, parse, **kwargs):
+        if self.cache is None:
+            response = await self.request("GET", url, **kwargs)
+            return await self._apply_parser(parse, response) if response is not None else None
+
+        entry = self.cache.get(key)
+        if entry is not None:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **self.cache.conditional_headers(entry)}
+
+        response = await self.request("GET", url, **kwargs)
+        if response is None:
+            return None
+
+        if entry is not None and response.status_code == 304:
+            self.cache.hits += 1
+            self.cache.touch(key)
+            if parse is not None and entry["parsed"] is not None:
+                return entry["parsed"]
+            response = httpx.Response(200, headers=entry["headers"], content=entry["body"], request=response.request)
+        elif entry is not None and (parse is None or entry["parsed"] is not None) and self.cache.is_same_body(entry, response):
+            self.cache.unchanged += 1
+            self.cache.touch(key)
+            if parse is not None:
+                return entry["parsed"]
+        else:
+            self.cache.misses += 1
+            self.cache.store(key, response)
+
+        if parse is None:
+            return response
+        parsed = await self._apply_parser(parse, response)
+        if parsed is not None:
+            self.cache.store_parsed(key, parsed)
+        return parsed
+
+    async def _apply_parser(self, parse, response):
+        if parse is None:
+            return response
+        parsed = parse(response)
+        if inspect.isawaitable(parsed):
+            parsed = await parsed
+        return parsed
+
+    async def run_parser(self, fn, response, *args):
+        # 응답 bytes만 넘기고 파싱 결과 dict만 돌려받는다
+        return await ParsePool.get().run(fn, response.content, response.charset_encoding, *args)
+
+    async def _send_hedged(self, hedge_key, method, url, **kwargs):
+        self.hedging.requests += 1
+        # 동시성 슬롯과 토큰을 받기까지의 대기는 서버 지연이 아니므로, 실제로 보낸 시점부터 시간을 잰다
+        sent = asyncio.Event()
+        primary = asyncio.ensure_future(self._send(method, url, on_sent=sent.set, **kwargs))
+        pending = {primary}
+        try:
+            waiting_sent = asyncio.ensure_future(sent.wait())
+            try:
+                await asyncio.wait({primary, waiting_sent}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                waiting_sent.cancel()
+            started = time.monotonic()
+
+            delay = self.hedging.delay(hedge_key)
+            if delay is not None:
+                done, _ = await asyncio.wait(pending, timeout=delay)
+                # 로컬 리미터가 밀려 있으면 hedge도 같은 줄에서 기다리며 부하만 늘리므로 보내지 않는다
+                if not done and not self.limits_backlogged(url) and self.hedging.try_hedge():
+                    self.logger.debug(f"🪞 [{self.platform}] {delay:.2f}초 초과, hedge 요청 전송 ({url})")
+                    pending.add(asyncio.ensure_future(self._send(method, url, **kwargs)))
+
+            # 먼저 성공한 응답을 쓰고, 모두 실패하면 마지막 에러를 올린다
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.hedging.hedge_wins += 1
+                        # 이긴 요청만의 지연을 넣으면 느린 primary가 빠져 임계값이 계속 내려가므로
+                        # primary를 실제로 보낸 시점부터 응답을 받기까지 걸린 시간을 기록한다
+                        self.hedging.record(hedge_key, time.monotonic() - started)
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def limits_backlogged(self, url):
+        if self.limiter.saturated():
+            return True
+        return not self.replay and HostRateLimiter.backlogged(url)
+
+    async def _send(self, method, url, gone_statuses=None, **kwargs):
+        self.breaker.before_request()
+        try:
+            response = await self._send_with_limits(method, url, gone_statuses=gone_statuses, **kwargs)
+        except ResponseTooLargeError:
+            self.breaker.on_success()
+            raise
+        except httpx.RequestError as e:
+            self.breaker.on_failure(type(e).__name__)
+            raise
+        except BaseException:
+            self.breaker.on_abort()
+            raise
+
+        # 삭제된 공고의 503은 서버 장애가 아니므로 서킷 실패로 세지 않는다
+        if self.retry_policy.is_retryable_status(response.status_code, gone_statuses):
+            self.breaker.on_failure(f"HTTP {response.status_code}")
+        else:
+            self.breaker.on_success()
+        return response
+
+    async def _send_with_limits(self, method, url, gone_statuses=None, **kwargs):
+        async with self.limiter:
+            # 카세트 재생은 오프라인이므로 예의상 두는 속도 제한이 필요 없다
+            if not self.replay:
+                await HostRateLimiter.acquire(url)
+            if on_sent := kwargs.pop("on_sent", None):
+                on_sent()
+            started = time.monotonic()
+            max_bytes = kwargs.pop("max_bytes", None) or Setting.RESPONSE_MAX_BYTES
+            extensions = {**kwargs.pop("extensions", {}), "trace": self.connection_stats.trace}
+            request = self.client.build_request(method, url, extensions=extensions, **kwargs)
+            try:
+                streamed = await self.client.send(request, stream=True)
+                try:
+                    response = await read_capped(streamed, max_bytes)
+                finally:
+                    await streamed.aclose()
+            except httpx.TimeoutException as e:
+                await self.limiter.on_overload(type(e).__name__)
+                raise
+            self.connection_stats.record_response(response)
+
+            if response.status_code in (429, 503) and not self.retry_policy.is_gone_status(response.status_code, gone_statuses):
+                await self.limiter.on_overload(f"HTTP {response.status_code}")
+            else:
+                await self.limiter.on_success(time.monotonic() - started)
+            return response
+
     async def __aenter__(self):
-        self.client = httpx.AsyncClient(
-            headers=self.header,
-            timeout=httpx.Timeout(15.0, connect=15.0),
-            follow_redirects=True
-        )
+        self.client = build_client(self.header, self.build_transport())
+        # 카세트 기록/재생은 결정적이어야 하므로 조건부 요청 캐시를 끈다
+        if Setting.HTTP_CACHE_DIR and not Setting.HTTP_CASSETTE_MODE:
+            self.cache = HttpCache(
+                os.path.join(Setting.HTTP_CACHE_DIR, f"{self.platform.lower()}.sqlite3"),
+                self.logger,
+                ttl_days=Setting.HTTP_CACHE_TTL_DAYS,
+                max_bytes=Setting.HTTP_CACHE_MAX_MB * 1024 * 1024,
+                parser_version=self.PARSER_VERSION,
+            )
         return self
 
+    def build_transport(self):
+        cassette_path = os.path.join(Setting.HTTP_CASSETTE_DIR, f"{self.platform.lower()}.jsonl.gz")
+        if self.replay:
+            latency = Setting.HTTP_REPLAY_LATENCY
+            latency = latency if latency == "recorded" else float(latency)
+            self.logger.info(f"📼 [{self.platform}] 카세트 재생 모드 ({cassette_path})")
+            return ReplayTransport(Cassette(cassette_path).load(), self.logger, latency=latency)
+
+        # 동시성 한도가 max_k까지 오를 수 있으므로 연결 수도 그만큼 열어 둔다
+        transport = build_transport(
+            self.logger,
+            http2=self.http2,
+            max_connections=self.max_k,
+            max_keepalive_connections=self.keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+        if Setting.HTTP_CASSETTE_MODE == "record":
+            self.logger.info(f"📼 [{self.platform}] 카세트 기록 모드 ({cassette_path})")
+            return RecordingTransport(transport, Cassette(cassette_path))
+        return transport
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.log_stats()
+        if self.cache:
+            self.cache.close()
         if self.client:
             await self.client.aclose()
 
+    def log_stats(self):
+        stats = self.limiter.stats()
+        self.logger.info(f"📊 [{self.platform}] 동시성 통계 | 현재 한도: {stats['limit']} (최대 {stats['peak_limit']}) | "
+                         f"성공: {stats['success']} | 과부하: {stats['overload']} | "
+                         f"증가/감소: {stats['increase']}/{stats['decrease']} | p95: {stats['p95']}s")
+        conn = self.connection_stats.stats()
+        self.logger.info(f"🔌 [{self.platform}] 연결 통계 | 요청: {conn['requests']} | 새 연결: {conn['new_connections']} | "
+                         f"재사용: {conn['reused']} | TLS 핸드셰이크: {conn['tls_handshakes']} | 프로토콜: {conn['http_versions']}")
+        hedging = self.hedging.stats()
+        if hedging["requests"]:
+            self.logger.info(f"🪞 [{self.platform}] Hedge 요청 | 대상: {hedging['requests']} | 전송: {hedging['hedged']} | "
+                             f"hedge 승리: {hedging['hedge_wins']} | 임계값: {hedging['thresholds']}")
+        breaker = self.breaker.stats()
+        self.logger.info(f"🧯 [{self.platform}] 서킷 브레이커 | 상태: {breaker['state']} | OPEN 횟수: {breaker['opened']} | 차단된 요청: {breaker['rejected']}")
+        flight = self.single_flight.stats()
+        self.logger.info(f"🔗 [{self.platform}] 중복 요청 병합 | 호출: {flight['calls']} | 병합: {flight['shared']}")
+        if self.cache:
+            cache = self.cache.stats()
+            self.logger.info(f"🗄️ [{self.platform}] 캐시 통계 | 304 적중: {cache['hits']} | 본문 동일: {cache['unchanged']} | "
+                             f"미스: {cache['misses']} | 적중률: {cache['hit_rate']:.1%} | 만료/삭제: {cache['evicted']}")
+
     @abstractmethod
     async def fetch_job_list(self, *args, **kwargs):
         pass
@@ -80,6 +345,14 @@ class BaseCrawler(ABC):
     async def fetch_company_info(self, *args, **kwargs):
         pass
 
+    @abstractmethod
+    async def fetch_job_pages(self, *args, **kwargs):
+        pass
+
+    @abstractmethod
+    async def parse_job_pages(self, *args, **kwargs):
+        pass
+
     async def close(self, *args, **kwargs):
         if self.client and not self.client.is_closed:
             await self.client.aclose()
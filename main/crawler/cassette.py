@@ -0,0 +1,109 @@
+import asyncio
+import base64
+import gzip
+import hashlib
+from utils import json_codec
+import os
+import time
+import httpx
+
+
+def request_key(request):
+    # 원티드 목록 요청의 타임스탬프 파라미터처럼 숫자로만 된 캐시 버스터는 키에서 제외한다
+    params = sorted((k, v) for k, v in request.url.params.multi_items() if not k.isdigit())
+    url = request.url.copy_with(query=None).copy_merge_params(params)
+    body_hash = hashlib.sha1(request.content).hexdigest() if request.content else ""
+    return f"{request.method} {url} {body_hash}"
+
+
+class Cassette:
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return self
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                record = json_codec.loads(line)
+                self.entries.setdefault(record["key"], []).append(record)
+        return self
+
+    def add(self, key, response, body, elapsed):
+        self.entries.setdefault(key, []).append({
+            "key": key,
+            "status": response.status_code,
+            "headers": response.headers.multi_items(),
+            "body": base64.b64encode(body).decode("ascii"),
+            "http_version": response.extensions.get("http_version", b"HTTP/1.1").decode("ascii"),
+            "elapsed": elapsed,
+        })
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with gzip.open(self.path, "wt", encoding="utf-8") as f:
+            for records in self.entries.values():
+                for record in records:
+                    f.write(json_codec.dumps(record) + "\n")
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """실제 응답을 그대로 돌려주면서 압축된 카세트 파일에 기록한다."""
+
+    def __init__(self, transport, cassette):
+        self.transport = transport
+        self.cassette = cassette
+
+    async def handle_async_request(self, request):
+        started = time.monotonic()
+        response = await self.transport.handle_async_request(request)
+        # 클라이언트가 다시 디코딩할 수 있도록 압축된 원본 바이트를 저장한다
+        try:
+            body = b"".join([chunk async for chunk in response.stream])
+        finally:
+            await response.aclose()
+        self.cassette.add(request_key(request), response, body, time.monotonic() - started)
+        return httpx.Response(response.status_code, headers=response.headers, content=body, extensions=response.extensions)
+
+    async def aclose(self):
+        self.cassette.save()
+        await self.transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """카세트에 기록된 응답을 네트워크 없이 돌려준다.
+
+    latency가 "recorded"면 기록 당시 응답 시간을, 숫자면 그만큼(초)을 지연시킨다.
+    """
+
+    def __init__(self, cassette, logger, latency=0.0):
+        self.cassette = cassette
+        self.logger = logger
+        self.latency = latency
+        self.cursors = {}
+        self.misses = 0
+
+    async def handle_async_request(self, request):
+        key = request_key(request)
+        records = self.cassette.entries.get(key)
+        if not records:
+            self.misses += 1
+            self.logger.warning(f"📼 카세트에 없는 요청입니다. 404로 응답합니다. ({key})")
+            return httpx.Response(404, content=b"", request=request)
+
+        # 같은 요청이 여러 번 기록됐으면 순서대로, 다 쓰면 마지막 응답을 반복한다
+        index = self.cursors.get(key, 0)
+        self.cursors[key] = index + 1
+        record = records[min(index, len(records) - 1)]
+
+        delay = record["elapsed"] if self.latency == "recorded" else self.latency
+        if delay:
+            await asyncio.sleep(delay)
+
+        return httpx.Response(
+            record["status"],
+            headers=record["headers"],
+            content=base64.b64decode(record["body"]),
+            extensions={"http_version": record["http_version"].encode("ascii")},
+        )
@@ -0,0 +1,87 @@
+import time
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, name, retry_after):
+        super().__init__(f"{name} 서킷이 열려 있습니다. {retry_after:.0f}초 후 재시도 가능")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """플랫폼 단위 서킷 브레이커.
+
+    연속 실패가 임계치를 넘으면 OPEN으로 바꿔 요청을 즉시 실패시키고,
+    open_timeout이 지나면 HALF_OPEN에서 탐색 요청 하나만 통과시켜 복구 여부를 본다.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name, logger, failure_threshold=10, open_timeout=30.0, max_open_timeout=600.0):
+        self.name = name
+        self.logger = logger
+        self.failure_threshold = failure_threshold
+        self.base_open_timeout = open_timeout
+        self.open_timeout = open_timeout
+        self.max_open_timeout = max_open_timeout
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+
+        self.open_count = 0
+        self.rejected_count = 0
+
+    def remaining(self):
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.opened_at + self.open_timeout - time.monotonic())
+
+    def before_request(self):
+        if self.state == self.OPEN:
+            if self.remaining() > 0:
+                self.rejected_count += 1
+                raise CircuitOpenError(self.name, self.remaining())
+            self.state = self.HALF_OPEN
+            self.logger.info(f"🟡 [{self.name}] 서킷 HALF-OPEN, 탐색 요청을 보냅니다.")
+
+        if self.state == self.HALF_OPEN:
+            if self.probe_in_flight:
+                self.rejected_count += 1
+                raise CircuitOpenError(self.name, self.open_timeout)
+            self.probe_in_flight = True
+
+    def on_success(self):
+        if self.state == self.HALF_OPEN:
+            self.logger.info(f"🟢 [{self.name}] 서킷 CLOSED, 정상화되었습니다.")
+            self.open_timeout = self.base_open_timeout
+        self.state = self.CLOSED
+        self.probe_in_flight = False
+        self.consecutive_failures = 0
+
+    def on_failure(self, reason):
+        self.consecutive_failures += 1
+        if self.state == self.HALF_OPEN:
+            # 탐색 실패 시 다음 OPEN 시간은 두 배로
+            self.open_timeout = min(self.max_open_timeout, self.open_timeout * 2)
+            self._open(reason)
+        elif self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold:
+            self._open(reason)
+
+    def _open(self, reason):
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+        self.probe_in_flight = False
+        self.open_count += 1
+        self.logger.warning(f"🔴 [{self.name}] 서킷 OPEN ({self.consecutive_failures}회 연속 실패, 마지막: {reason}) | "
+                            f"{self.open_timeout:.0f}초 동안 요청을 차단합니다.")
+
+    def on_abort(self):
+        # 취소 등으로 결과를 모르는 탐색 요청은 다음 요청이 다시 탐색하도록 풀어준다
+        self.probe_in_flight = False
+
+    def stats(self):
+        return {"state": self.state, "opened": self.open_count, "rejected": self.rejected_count}
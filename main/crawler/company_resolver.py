@@ -0,0 +1,79 @@
+import asyncio
+
+
+class CompanyResolver:
+    """한 번의 실행 동안 회사 정보를 다시 받아야 하는지 한 곳에서 정한다.
+
+    비슷한 시점에 들어온 회사 id들의 신선도 확인은 IN 쿼리 한 번으로 묶고,
+    이번 실행에서 이미 확인했거나 받은(받는 중인) 회사는 그 결과를 그대로 돌려준다.
+    """
+
+    def __init__(self, lookup, batch_window=0.05):
+        self.lookup = lookup
+        self.batch_window = batch_window
+        self.resolved = {}
+        self.pending = {}
+        self.flush_handle = None
+
+        self.calls = 0
+        self.queries = 0
+        self.fetched = 0
+        self.reused = 0
+        self.saved_fetches = 0
+
+    async def resolve(self, company_id, fetch):
+        """새로 받아야 하는 회사면 fetch()의 결과를, 이미 최신이면 None을 돌려준다."""
+        self.calls += 1
+        if company_id is None:
+            self.fetched += 1
+            return await fetch()
+
+        if (future := self.resolved.get(company_id)) is not None:
+            self.reused += 1
+            company_info = await asyncio.shield(future)
+            if company_info is not None:
+                self.saved_fetches += 1
+            return company_info
+
+        future = asyncio.ensure_future(self._resolve(company_id, fetch))
+        self.resolved[company_id] = future
+        # 실패한 조회/수집은 기억하지 않고 다음 공고에서 다시 시도한다
+        future.add_done_callback(lambda f: (f.cancelled() or f.exception() is not None) and self.resolved.pop(company_id, None))
+        return await asyncio.shield(future)
+
+    async def _resolve(self, company_id, fetch):
+        if await self._need_crawling(company_id) not in ("new", "renew"):
+            return None
+        self.fetched += 1
+        return await fetch()
+
+    async def _need_crawling(self, company_id):
+        future = asyncio.get_running_loop().create_future()
+        self.pending[company_id] = future
+        if self.flush_handle is None:
+            self.flush_handle = asyncio.get_running_loop().call_later(self.batch_window, self._flush)
+        return await future
+
+    def _flush(self):
+        pending, self.pending, self.flush_handle = self.pending, {}, None
+        try:
+            flags = self.lookup(list(pending))
+        except Exception as e:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        self.queries += 1
+        for company_id, future in pending.items():
+            if not future.done():
+                future.set_result(flags.get(company_id, "new"))
+
+    def stats(self):
+        return {
+            "calls": self.calls,
+            "queries": self.queries,
+            "fetched": self.fetched,
+            "reused": self.reused,
+            "saved_fetches": self.saved_fetches,
+            "saved_queries": self.calls - self.queries,
+        }
@@ -0,0 +1,128 @@
+import asyncio
+import time
+from collections import deque
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD 방식으로 동시 요청 수를 조절하는 리미터.
+
+    응답 지연(p95)과 에러율이 안정적이면 한도를 1씩 늘리고,
+    타임아웃/429/503 또는 p95 급증 시 한도를 배수로 줄인다.
+    """
+
+    def __init__(self, name, logger, initial_limit=5, min_limit=1, max_limit=20,
+                 decrease_factor=0.5, latency_window=50, latency_tolerance=2.0, cooldown=5.0):
+        self.name = name
+        self.logger = logger
+        self.limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.cooldown = cooldown
+
+        self.in_flight = 0
+        self.latencies = deque(maxlen=latency_window)
+        self.baseline_p95 = None
+
+        self.success_count = 0
+        self.overload_count = 0
+        self.increase_count = 0
+        self.decrease_count = 0
+        self.peak_limit = initial_limit
+
+        self._since_increase = 0
+        self._last_decrease = 0.0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+    async def release(self):
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def saturated(self):
+        return self.in_flight >= self.limit
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.release()
+
+    def p95(self):
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    async def on_success(self, latency):
+        self.success_count += 1
+        self.latencies.append(latency)
+
+        current_p95 = self.p95()
+        if len(self.latencies) < self.latencies.maxlen // 2:
+            await self._additive_increase()
+            return
+
+        if self.baseline_p95 is None:
+            self.baseline_p95 = current_p95
+        elif current_p95 > self.baseline_p95 * self.latency_tolerance:
+            await self._multiplicative_decrease(f"p95 지연 증가 {current_p95:.2f}s (기준 {self.baseline_p95:.2f}s)")
+            return
+        else:
+            self.baseline_p95 = min(current_p95, self.baseline_p95 * 0.9 + current_p95 * 0.1)
+
+        await self._additive_increase()
+
+    async def on_overload(self, reason):
+        self.overload_count += 1
+        await self._multiplicative_decrease(reason)
+
+    async def _additive_increase(self):
+        # 한도만큼 성공해야(대략 1 RTT) 1 증가
+        self._since_increase += 1
+        if self._since_increase < self.limit or self.limit >= self.max_limit:
+            return
+        self._since_increase = 0
+        await self._set_limit(self.limit + 1, "응답 안정")
+        self.increase_count += 1
+
+    async def _multiplicative_decrease(self, reason):
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self._since_increase = 0
+        self.latencies.clear()
+        await self._set_limit(max(self.min_limit, int(self.limit * self.decrease_factor)), reason)
+        self.decrease_count += 1
+
+    async def _set_limit(self, new_limit, reason):
+        if new_limit == self.limit:
+            return
+        old_limit, self.limit = self.limit, new_limit
+        self.peak_limit = max(self.peak_limit, new_limit)
+        arrow = "📈" if new_limit > old_limit else "📉"
+        self.logger.info(f"{arrow} [{self.name}] 동시성 한도 {old_limit} → {new_limit} ({reason})")
+        if new_limit > old_limit:
+            async with self._condition:
+                self._condition.notify_all()
+
+    def stats(self):
+        p95 = self.p95()
+        return {
+            "limit": self.limit,
+            "peak_limit": self.peak_limit,
+            "in_flight": self.in_flight,
+            "success": self.success_count,
+            "overload": self.overload_count,
+            "increase": self.increase_count,
+            "decrease": self.decrease_count,
+            "p95": round(p95, 3) if p95 is not None else None,
+        }
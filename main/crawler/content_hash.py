@@ -0,0 +1,20 @@
+import hashlib
+import re
+
+# 요청마다 달라지는 스크립트/스타일/주석은 해시에서 뺀다 (JSON에 담긴 HTML의 <\/script>도 포함)
+VOLATILE_PATTERN = re.compile(rb"<script\b.*?<\\?/script\s*>|<style\b.*?<\\?/style\s*>|<!--.*?-->", re.I | re.S)
+WHITESPACE_PATTERN = re.compile(rb"\s+")
+
+
+def normalize_body(content):
+    content = VOLATILE_PATTERN.sub(b"", content)
+    return WHITESPACE_PATTERN.sub(b" ", content).strip()
+
+
+def content_hash(pages):
+    """공고 하나를 구성하는 응답들의 정규화된 본문으로 sha256 해시를 만든다."""
+    digest = hashlib.sha256()
+    for name in sorted(pages):
+        digest.update(name.encode("ascii") + b"\0")
+        digest.update(normalize_body(pages[name].content) + b"\0")
+    return digest.hexdigest()
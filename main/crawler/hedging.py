@@ -0,0 +1,44 @@
+from collections import deque
+
+
+class HedgePolicy:
+    """엔드포인트별 지연 분포를 보고 느린 요청에 복제 요청(hedge)을 보낼 시점을 정한다.
+
+    최근 지연의 percentile을 넘기면 한 번 더 보내되, 전체 요청 대비 hedge 비율은 max_ratio로 묶는다.
+    """
+
+    def __init__(self, percentile=0.95, window=100, min_samples=20, max_ratio=0.1, min_delay=0.05):
+        self.percentile = percentile
+        self.window = window
+        self.min_samples = min_samples
+        self.max_ratio = max_ratio
+        self.min_delay = min_delay
+
+        self.latencies = {}
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def delay(self, key):
+        samples = self.latencies.get(key)
+        if samples is None or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        return max(self.min_delay, ordered[min(len(ordered) - 1, int(len(ordered) * self.percentile))])
+
+    def record(self, key, latency):
+        self.latencies.setdefault(key, deque(maxlen=self.window)).append(latency)
+
+    def try_hedge(self):
+        if self.hedged + 1 > self.requests * self.max_ratio:
+            return False
+        self.hedged += 1
+        return True
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "thresholds": {key: round(self.delay(key), 3) for key in self.latencies if self.delay(key) is not None},
+        }
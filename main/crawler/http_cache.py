@@ -0,0 +1,149 @@
+import hashlib
+from utils import json_codec
+import os
+import sqlite3
+import time
+import httpx
+
+
+class HttpCache:
+    """GET 응답 본문과 ETag/Last-Modified를 sqlite에 저장하는 디스크 캐시.
+
+    재방문 시 조건부 요청을 보내고, 304이거나 본문이 그대로면
+    저장해 둔 파싱 결과를 돌려줘서 다운로드와 재파싱을 모두 건너뛴다.
+    파싱 결과는 parser_version이 같을 때만 다시 쓰고, TTL은 재검증과 상관없이 처음 받은 시각부터 센다.
+    """
+
+    def __init__(self, path, logger, ttl_days=14, max_bytes=200 * 1024 * 1024, parser_version=None):
+        self.path = path
+        self.logger = logger
+        self.ttl = ttl_days * 24 * 60 * 60
+        self.max_bytes = max_bytes
+        self.parser_version = str(parser_version)
+
+        self.hits = 0
+        self.unchanged = 0
+        self.misses = 0
+        self.evicted = 0
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS http_cache (
+                cache_key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                body_hash TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                parsed TEXT,
+                parser_version TEXT,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                validated_at REAL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        # 이전 버전에서 만든 캐시 파일에는 없는 컬럼을 채워 넣는다
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(http_cache)")}
+        for column in ("parser_version TEXT", "validated_at REAL"):
+            if column.split()[0] not in columns:
+                self.conn.execute(f"ALTER TABLE http_cache ADD COLUMN {column}")
+        self.conn.commit()
+        self.evict()
+
+    @staticmethod
+    def make_key(url, params=None):
+        return str(httpx.URL(url, params=params))
+
+    def get(self, key):
+        row = self.conn.execute(
+            "SELECT headers, body, body_hash, etag, last_modified, parsed, parser_version, stored_at FROM http_cache WHERE cache_key = ?",
+            (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        headers, body, body_hash, etag, last_modified, parsed, parser_version, stored_at = row
+        # 실행 도중에 TTL이 지난 항목도 없는 것으로 보고 새로 받는다 (evict는 열고 닫을 때만 돈다)
+        if stored_at + self.ttl < time.time():
+            return None
+        # 파서가 바뀐 뒤에는 본문만 재사용하고 파싱은 다시 한다
+        if parser_version != self.parser_version:
+            parsed = None
+        return {
+            "headers": json_codec.loads(headers),
+            "body": body,
+            "body_hash": body_hash,
+            "etag": etag,
+            "last_modified": last_modified,
+            "parsed": json_codec.loads(parsed) if parsed is not None else None,
+        }
+
+    def conditional_headers(self, entry):
+        headers = {}
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, key, response):
+        body = response.content
+        now = time.time()
+        # 본문은 이미 디코딩된 상태로 저장되므로 전송 관련 헤더는 버린다
+        headers = {k: v for k, v in response.headers.items()
+                   if k.lower() not in ("content-encoding", "content-length", "transfer-encoding")}
+        self.conn.execute(
+            """INSERT OR REPLACE INTO http_cache
+               (cache_key, url, headers, body, body_hash, etag, last_modified, parsed, parser_version, size,
+                stored_at, validated_at, accessed_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, NULL, NULL, ?, ?, ?, ?)""",
+            (key, str(response.url), json_codec.dumps(headers), body, hashlib.sha256(body).hexdigest(),
+             response.headers.get("ETag"), response.headers.get("Last-Modified"), len(body), now, now, now),
+        )
+        self.conn.commit()
+
+    def touch(self, key):
+        # 재검증 시각만 남기고 stored_at은 그대로 둬서, 304가 계속 와도 TTL이 지나면 새로 받는다
+        now = time.time()
+        self.conn.execute("UPDATE http_cache SET validated_at = ?, accessed_at = ? WHERE cache_key = ?", (now, now, key))
+        self.conn.commit()
+
+    def store_parsed(self, key, parsed):
+        self.conn.execute("UPDATE http_cache SET parsed = ?, parser_version = ? WHERE cache_key = ?",
+                          (json_codec.dumps(parsed), self.parser_version, key))
+        self.conn.commit()
+
+    def is_same_body(self, entry, response):
+        return hashlib.sha256(response.content).hexdigest() == entry["body_hash"]
+
+    def evict(self):
+        expired = self.conn.execute("DELETE FROM http_cache WHERE stored_at < ?", (time.time() - self.ttl,)).rowcount
+
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+        overflow = 0
+        if total > self.max_bytes:
+            # 오래 안 쓴 항목부터 용량 한도 밑으로 내려갈 때까지 삭제
+            for key, size in self.conn.execute("SELECT cache_key, size FROM http_cache ORDER BY accessed_at").fetchall():
+                if total <= self.max_bytes:
+                    break
+                self.conn.execute("DELETE FROM http_cache WHERE cache_key = ?", (key,))
+                total -= size
+                overflow += 1
+        self.conn.commit()
+        self.evicted += expired + overflow
+
+    def stats(self):
+        lookups = self.hits + self.unchanged + self.misses
+        return {
+            "hits": self.hits,
+            "unchanged": self.unchanged,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.unchanged) / lookups, 3) if lookups else 0.0,
+            "evicted": self.evicted,
+        }
+
+    def close(self):
+        self.evict()
+        self.conn.close()
@@ -0,0 +1,82 @@
+import importlib.util
+import httpx
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class ResponseTooLargeError(Exception):
+    def __init__(self, url, max_bytes):
+        super().__init__(f"응답 본문이 {max_bytes:,} bytes를 넘어 중단했습니다. ({url})")
+        self.url = url
+        self.max_bytes = max_bytes
+
+
+async def read_capped(response, max_bytes):
+    """스트리밍 응답을 디코딩하면서 읽고, max_bytes를 넘으면 즉시 중단한다."""
+    content_length = response.headers.get("Content-Length")
+    if content_length and content_length.isdigit() and "Content-Encoding" not in response.headers and int(content_length) > max_bytes:
+        raise ResponseTooLargeError(response.url, max_bytes)
+
+    body = bytearray()
+    async for chunk in response.aiter_bytes():
+        body += chunk
+        if len(body) > max_bytes:
+            raise ResponseTooLargeError(response.url, max_bytes)
+
+    # 이미 디코딩된 본문이므로 인코딩 헤더를 빼고 새 응답으로 감싼다
+    headers = [(k, v) for k, v in response.headers.multi_items() if k.lower() not in ("content-encoding", "content-length")]
+    return httpx.Response(response.status_code, headers=headers, content=bytes(body),
+                          request=response.request, extensions=response.extensions)
+
+
+class ConnectionStats:
+    """httpcore trace 이벤트로 새 연결/재사용 연결 수를 센다."""
+
+    def __init__(self):
+        self.requests = 0
+        self.new_connections = 0
+        self.tls_handshakes = 0
+        self.http_versions = {}
+
+    async def trace(self, event_name, info):
+        if event_name == "connection.connect_tcp.complete":
+            self.new_connections += 1
+        elif event_name == "connection.start_tls.complete":
+            self.tls_handshakes += 1
+
+    def record_response(self, response):
+        self.requests += 1
+        self.http_versions[response.http_version] = self.http_versions.get(response.http_version, 0) + 1
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "new_connections": self.new_connections,
+            "reused": max(0, self.requests - self.new_connections),
+            "tls_handshakes": self.tls_handshakes,
+            "http_versions": dict(self.http_versions),
+        }
+
+
+def build_transport(logger, http2=True, max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0):
+    if http2 and not HTTP2_AVAILABLE:
+        logger.warning("⚠️  h2 패키지가 없어 HTTP/1.1로 연결합니다. (pip install 'httpx[http2]')")
+        http2 = False
+
+    return httpx.AsyncHTTPTransport(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+    )
+
+
+def build_client(headers, transport):
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=httpx.Timeout(15.0, connect=15.0),
+        follow_redirects=True,
+        transport=transport,
+    )
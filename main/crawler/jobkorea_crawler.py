@@ -1,17 +1,108 @@
 from .base_crawler import BaseCrawler
 import time
 import asyncio
-import json
+from utils import json_codec
 import pprint
-import html2text
-from bs4 import BeautifulSoup
+from parsing import IMAGE, get_classifier, parse_html, render_markdown, sanitize_detail, section_filter
+from parsing.schema import Field, LabeledFields, first_string, joined_strings
+from parsing.stream import StreamingExtractor, has_class
 import re
-import emoji
 from utils.logger import setup_logger
 
+# SwipeGIReadInfo에서 읽는 섹션 (모집요강, 마감일, 기업정보, 태그, 복리후생, 근무지)
+SUMMARY_SECTIONS = [
+    ("div", {"id": "rowGuidelines"}),
+    ("ul", {"class": "view-top-list"}),
+    ("div", {"class": "receiptTermDate"}),
+    (None, {"id": "rowCompany"}),
+    (None, {"id": "rowKeyword"}),
+    (None, {"id": "rowTag"}),
+    (None, {"id": "rowBenefits"}),
+    ("div", {"class": "row rowLocation"}),
+    ("ul", {"class": "info-company-tag"}),
+]
+# 모집요강 (경력, 학력, 고용형태)
+GUIDELINE_FIELDS = LabeledFields("div.field", "div.label", "div.value", {
+    "경력": ("career", Field(extract=joined_strings)),
+    "학력": ("education", Field(extract=joined_strings)),
+    "고용형태": ("employment_type", Field(extract=joined_strings)),
+})
+
+# 신규 레이아웃(companyHeader) 기업 요약
+COMPANY_SUMMARY_FIELDS = LabeledFields("div.generalSummary > div.field.ellipsis", ".label", ".value", {
+    "산업": ("industry", Field()),
+    "사원수": ("employees", Field(extract=first_string, post=lambda value: value.replace("명", ""))),
+    "기업구분": ("classification", Field(extract=first_string)),
+    "설립일": ("foundation_date", Field(extract=first_string)),
+})
+
+# 구 레이아웃(info-company) 기업 요약
+COMPANY_LIST_FIELDS = LabeledFields("ul.info-company-list > li", "dl > :nth-child(1)", "dl > :nth-child(2)", {
+    "직원수": ("employees", Field()),
+    "기업구분": ("classification", Field(post=lambda value: value.replace("명", ""))),
+    "산업": ("industry", Field()),
+    "위치": ("address", Field()),
+})
+
+# 기업 페이지 기본정보 표
+COMPANY_BASIC_FIELDS = LabeledFields("div.table-basic-infomation > div.field", "div.field-label", "div.field-value", {
+    "산업": ("industry", Field(extract=first_string)),
+    "사원수": ("employees", Field(extract=first_string, post=lambda value: value.replace("명", ""))),
+    "기업구분": ("classification", Field(extract=first_string)),
+    "설립일": ("foundation_date", Field(extract=first_string)),
+    "주소": ("address", Field(extract=first_string)),
+})
+
+
+class GIReadParser(StreamingExtractor):
+    """GI_Read에서 공고 제목(div.recruit-article-content h1.recruit-title)과
+    하단 지원 버튼(div.navbarFooter > button의 마지막)만 읽고, 둘 다 찾으면 멈춘다."""
+
+    def __init__(self):
+        super().__init__()
+        self.position = None
+        self.disabled = None
+        self.article_depth = None
+        self.article_closed = False
+        self.title_depth = None
+        self.title_parts = []
+        self.footer_depth = None
+        self.footer_closed = False
+
+    def start(self, tag, attrs):
+        depth = len(self.stack)
+        if tag == "div" and self.article_depth is None and not self.article_closed and has_class(attrs, "recruit-article-content"):
+            self.article_depth = depth
+        elif tag == "h1" and self.article_depth is not None and self.position is None and self.title_depth is None \
+                and has_class(attrs, "recruit-title"):
+            self.title_depth = depth
+        elif tag == "div" and self.footer_depth is None and has_class(attrs, "navbarFooter"):
+            self.footer_depth = depth
+        elif tag == "button" and self.footer_depth is not None and not self.footer_closed and depth == self.footer_depth + 1:
+            # 값 없는 disabled 속성은 BeautifulSoup과 같이 빈 문자열로 본다
+            self.disabled = (attrs["disabled"] or "") if "disabled" in attrs else None
+
+    def end(self, tag):
+        depth = len(self.stack)
+        if self.title_depth is not None and depth <= self.title_depth:
+            self.position = "".join(self.title_parts).strip()
+            self.title_depth = None
+        if self.article_depth is not None and depth <= self.article_depth:
+            self.article_depth = None
+            self.article_closed = True
+        if self.footer_depth is not None and depth <= self.footer_depth:
+            self.footer_closed = True
+        self.done = self.position is not None and self.footer_closed
+
+    def data(self, text):
+        if self.title_depth is not None:
+            self.title_parts.append(text)
+
 class JobkoreaCrawler(BaseCrawler):
-    def __init__(self, logger, k=5):
-        super().__init__(base_url="https://m.jobkorea.co.kr", platform="Jobkorea", logger=logger, k=k)
+    # 요약/제목/상세가 모두 m.jobkorea로 가고 www는 목록 조회에만 써서 유휴 연결을 조금 줄인다
+    def __init__(self, logger, k=5, max_k=20, http2=True, keepalive_connections=12):
+        super().__init__(base_url="https://m.jobkorea.co.kr", platform="Jobkorea", logger=logger, k=k, max_k=max_k,
+                         http2=http2, keepalive_connections=keepalive_connections)
         self.job_list_url = "https://www.jobkorea.co.kr/Search/api/display/v2/jobs"
         self.job_detail_url = f"{self.base_url}/Recruit/GIReadDetailContentIframe"
         self.job_summary_info = f"{self.base_url}/Recruit/SwipeGIReadInfo"
@@ -29,54 +120,35 @@ class JobkoreaCrawler(BaseCrawler):
                           '자격', '우대', '모집', '업무', '지원', '전형', '마감', '근무']
 
     async def fetch_job_list(self):
-        response = await self.request("POST", self.job_list_url, headers=self.header, json=self.payload)
-        gnos = [job["id"] for job in response.json().get('content')]
+        response = await self.request("POST", self.job_list_url, headers=self.header, json=self.payload, max_bytes=self.max_body_bytes["list"])
+        gnos = [job["id"] for job in json_codec.response_json(response).get('content')]
         return gnos
 
     async def fetch_job_detail(self, gno):
-        response = await self.request("GET", f'{self.job_detail_url}/{gno}', headers=self.header)
-        html_content = response.text
-        soup = BeautifulSoup(html_content, 'html.parser')
-
-        for element in soup(["script", "style", "noscript"]):
-            element.extract()
-        images = [f'https:{img.get("src")}' if img.get("src").startswith("//") else img.get("src") for img in soup.find_all('img') if img.get("src")]
-        has_image = len(images) > 0
+        return await self.parse_detail_response(await self.request_job_detail(gno))
 
-        for tag in soup.find_all('p', attrs={'hidden': True}):
-            tag.decompose()
-    
-        hidden_style_pattern = re.compile(r'(font-size:\s*0|height:\s*0|width:\s*0|display:\s*none|visibility:\s*hidden)', re.IGNORECASE)
-        hidden_tags = soup.find_all(attrs={"style": hidden_style_pattern})
-        for tag in hidden_tags:
-            tag.decompose()
+    async def request_job_detail(self, gno):
+        # content_hash를 원본 본문으로 계산하므로 파싱 결과 대신 응답을 캐시해 조건부 GET(304)을 쓴다
+        return await self.fetch_cached_response(f'{self.job_detail_url}/{gno}', headers=self.header, hedge="job_detail",
+                                                gone_statuses=self.retry_policy.posting_gone_statuses,
+                                                max_bytes=self.max_body_bytes["detail"])
 
-        blind_tags = soup.find_all(class_=re.compile(r'(blind|hidden|sr-only)'))
-        for tag in blind_tags:
-            tag.decompose()
+    async def parse_detail_response(self, response):
+        if response is None:
+            return None
+        return self.check_content_type(await self.run_parser(JobkoreaCrawler.parse_job_detail, response, self.keyword))
 
-        clean_text = soup.get_text(separator=' ', strip=True)
-        text_length = len(clean_text)
+    def check_content_type(self, detail):
+        if detail is not None and detail["content_type"] == IMAGE:
+            self.logger.info(f"⚠️  본문이 짧거나 핵심 키워드가 없어 이미지 공고로 판단합니다.")
+        return detail
 
-        has_keyword = any(keyword in clean_text for keyword in self.keyword)
-        has_emoji = len(emoji.emoji_list(clean_text)) > 0
+    @staticmethod
+    def parse_job_detail(content, encoding, keywords):
+        soup, clean_text, images = sanitize_detail(parse_html(content, encoding))
+        content_type, _ = get_classifier(keywords).classify(clean_text, has_image=len(images) > 0)
 
-        content_type = "text"
-
-        if text_length < 200:
-            content_type = "image" if has_image else "text"
-        
-        if not has_keyword and has_image:
-            if has_emoji:
-                content_type = "text"
-            self.logger.info(f"⚠️  텍스트는 길지만 핵심 키워드가 없어 IMAGE 공고로 판단합니다.")
-            content_type = "image"
-
-        h = html2text.HTML2Text()
-        h.ignore_links = False
-        h.ignore_images = True
-        h.body_width = 0
-        markdown_text = h.handle(str(soup))
+        markdown_text = render_markdown(soup)
 
         return {
             "content_type": content_type,
@@ -84,28 +156,53 @@ class JobkoreaCrawler(BaseCrawler):
             "images": images
         }
     
+    async def request_job_summary(self, gno):
+        headers = {**self.header, "X-Requested-With": "XMLHttpRequest"}
+        gone_statuses = self.retry_policy.posting_gone_statuses
+        # 요약 정보와 제목/지원 상태 페이지는 서로 독립적이므로 동시에 요청한다
+        summary_response, basic_response = await asyncio.gather(
+            self.request("POST", f'{self.job_summary_info}/{gno}', headers=headers, gone_statuses=gone_statuses, max_bytes=self.max_body_bytes["summary"]),
+            self.request("GET", f'{self.job_basic_url}/{gno}', headers=headers, gone_statuses=gone_statuses, max_bytes=self.max_body_bytes["summary"]),
+        )
+        if summary_response is None or basic_response is None:
+            self.logger.warning(f"🚫 [Skip] 유효하지 않은 공고입니다. (GNO: {gno})")
+            return None
+        return summary_response, basic_response
+
     async def fetch_job_summary(self, gno):
-        self.header.update({"X-Requested-With": "XMLHttpRequest"})
-        response = await self.request("POST", f'{self.job_summary_info}/{gno}', headers=self.header)
-        html_content = response.text
-        
-        if "채용공고가 존재하지 않습니다." in html_content or "채용공고가 삭제되어 상세 내용을 확인할 수 없습니다." in html_content:
+        return await self.parse_summary_responses(gno, await self.request_job_summary(gno))
+
+    async def parse_summary_responses(self, gno, responses):
+        if responses is None:
+            return None
+        summary_response, basic_response = responses
+
+        summary, basic_info = await asyncio.gather(
+            self.run_parser(JobkoreaCrawler.parse_summary_info, summary_response, self.base_url),
+            self.run_parser(JobkoreaCrawler.parse_basic_info, basic_response),
+        )
+        if summary is None:
             self.logger.warning(f"🚫 [Skip] 유효하지 않은 공고입니다. (GNO: {gno})")
             return None
 
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
+        return {
+            "gno": gno,
+            "job_url": f"https://m.jobkorea.co.kr/Recruit/GI_Read/{gno}",
+            **basic_info,
+            **summary
+        }
+
+    @staticmethod
+    def parse_summary_info(content, encoding, base_url):
+        html_content = content.decode(encoding or "utf-8", errors="replace")
+        if "채용공고가 존재하지 않습니다." in html_content or "채용공고가 삭제되어 상세 내용을 확인할 수 없습니다." in html_content:
+            return None
+
+        soup = parse_html(html_content, parse_only=section_filter(SUMMARY_SECTIONS))
+
         summary_dict = dict()
         if summary_items := soup.select_one('div#rowGuidelines'):
-            for item in summary_items.select('div.field'):
-                key = item.select_one('div.label').text.strip()
-                value = item.select_one('div.value').get_text(separator=" ", strip=True)
-                if key == "경력":
-                    summary_dict.update({"career": value})
-                elif key == "학력":
-                    summary_dict.update({"education": value})
-                elif key == "고용형태":
-                    summary_dict.update({"employment_type": value})
+            summary_dict.update(GUIDELINE_FIELDS(summary_items))
         else:
             summary_dict.update({
                 'career': soup.select_one('ul.view-top-list > li.vl-history').text.strip()
@@ -122,36 +219,16 @@ class JobkoreaCrawler(BaseCrawler):
             company_info = dict()
             if has_company.select_one('div.companyHeader'):
                 company_name = has_company.select_one('div.companyHeader > div.header > h2').text.strip()
-                for item in has_company.select('div.generalSummary > div.field.ellipsis'):
-                    key = item.select_one('.label').text.strip()
-                    value = item.select_one('.value')
-                    if key == "산업":
-                        company_info.update({"industry": value.text.strip()})
-                    if key == "사원수":
-                        company_info.update({"employees": value.contents[0].strip().replace("명","")})
-                    if key == "기업구분":
-                        company_info.update({"classification": value.contents[0].strip()})
-                    if key == "설립일":
-                        company_info.update({"foundation_date": value.contents[0].strip()})
+                company_info.update(COMPANY_SUMMARY_FIELDS(has_company))
             elif has_company.select_one('div.info-company'):
                 company_name = has_company.select_one('div.info-company > p').contents[0].strip()
-                for item in has_company.select('ul.info-company-list > li'):
-                    key = item.select_one('dl > :nth-child(1)').text.strip()
-                    value = item.select_one('dl > :nth-child(2)').text.strip()
-                    if key == "직원수":
-                        company_info.update({"employees": value})
-                    if key == "기업구분":
-                        company_info.update({"classification": value.replace("명","")})
-                    if key == "산업":
-                        company_info.update({"industry": value})
-                    if key == "위치":
-                        company_info.update({"address": value})
+                company_info.update(COMPANY_LIST_FIELDS(has_company))
             company_info.update({"company_name": company_name})
 
             for selector in ['div.row-footer > a', 'div.header_wrap > a']:
                 if company_id := has_company.select_one(selector):
                     company_id = company_id.get('href')
-                    company_url = self.base_url + company_id
+                    company_url = base_url + company_id
                     if "company" in company_id:
                         company_id = company_id.split('/')[2].split('?')[0]
                     elif "Recruit" in company_id:
@@ -184,20 +261,8 @@ class JobkoreaCrawler(BaseCrawler):
         elif has_address := soup.select_one('#rowCompany > ul.info-company-list'):
             address = soup.select_one('ul.info-company-list > li:nth-child(4) > dl > dd').contents[0].strip()
 
-        response = await self.request("GET", f'{self.job_basic_url}/{gno}', headers=self.header)
-        html_content = response.text
-        soup = BeautifulSoup(html_content, 'html.parser')
-
-        if has_info := soup.select_one('div.recruit-article-content'):
-            position = has_info.select_one('h1.recruit-title').text.strip()
-        is_active = not soup.select('div.navbarFooter > button')[-1].get('disabled')
-
         return {
-            "gno": gno,
-            "job_url": f"https://m.jobkorea.co.kr/Recruit/GI_Read/{gno}",
-            "position": position,
             "deadline": deadline,
-            "is_active": bool(is_active),
             "address": address if has_address else None,
             "related_tags": related_tags if has_tag else None,
             "benefits": benefits if has_benefit else None,
@@ -206,10 +271,39 @@ class JobkoreaCrawler(BaseCrawler):
             **summary_dict
         }
 
+    @staticmethod
+    def parse_basic_info(content, encoding):
+        parser = GIReadParser().parse(content, encoding)
+        return {
+            "position": parser.position,
+            "is_active": not parser.disabled,
+        }
+
+    async def fetch_job_pages(self, gno):
+        # 본문 해시를 내야 하므로 상세 본문은 파싱 결과 캐시(fetch_cached)를 거치지 않고 받는다
+        # 요약/제목 페이지와 상세 본문은 서로 의존하지 않으므로 세 요청을 한 번에 보낸다
+        responses, detail_response = await asyncio.gather(
+            self.request_job_summary(gno),
+            self.request_job_detail(gno),
+        )
+        if responses is None or detail_response is None:
+            return None
+        summary_response, basic_response = responses
+        return {"summary": summary_response, "basic": basic_response, "detail": detail_response}
+
+    async def parse_job_pages(self, gno, pages):
+        return await asyncio.gather(
+            self.parse_summary_responses(gno, (pages["summary"], pages["basic"])),
+            self.parse_detail_response(pages["detail"]),
+        )
+
     async def fetch_company_info(self, company_url):
-        response = await self.request('GET', company_url)
-        html_content = response.text
-        soup = BeautifulSoup(html_content, 'html.parser')
+        return await self.fetch_cached(company_url, lambda response: self.run_parser(JobkoreaCrawler.parse_company_info, response, company_url),
+                                       max_bytes=self.max_body_bytes["company"])
+
+    @staticmethod
+    def parse_company_info(content, encoding, company_url):
+        soup = parse_html(content, encoding)
     
         company_info = dict()
         if any(pattern in company_url for pattern in ['company', 'Company', 'Recruit']):
@@ -222,19 +316,7 @@ class JobkoreaCrawler(BaseCrawler):
             for info_item in info_items:
                 info_item_class_name = info_item.get('class')[-1]
                 if info_item_class_name == 'company-body-container-basic-infomation':
-                    for item in soup.select('div.table-basic-infomation > div.field'):
-                        key = item.select_one('div.field-label').text.strip()
-                        value = item.select_one('div.field-value').contents[0].strip()
-                        if key == '산업':
-                            company_info.update({'industry': value})
-                        if key == '사원수':
-                            company_info.update({'employees': value.replace("명","")})
-                        if key == '기업구분':
-                            company_info.update({'classification': value})
-                        if key == '설립일':
-                            company_info.update({'foundation_date': value})
-                        if key == '주소':
-                            company_info.update({'address': value})
+                    company_info.update(COMPANY_BASIC_FIELDS(soup))
                 elif info_item_class_name == 'company-body-container-working-environment':
                     if comapny_intro := info_item.select('div.container-body > introduce-body'):
                         company_info.update({'introduction': comapny_intro.text.strip()})
@@ -267,11 +349,10 @@ class JobkoreaCrawler(BaseCrawler):
         }
 
     async def fetch_job(self, gno):
-        job_summaray = await self.fetch_job_summary(gno)
+        job_summaray, detail_contents = await asyncio.gather(self.fetch_job_summary(gno), self.fetch_job_detail(gno))
         if job_summaray is None:
             return None
 
-        detail_contents = await self.fetch_job_detail(gno)
         if company_url := job_summaray["company_info"]["company_url"]:
             company_info = await self.fetch_company_info(company_url)
         else:
@@ -0,0 +1,38 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from config.setting import Setting
+
+
+class ParsePool:
+    """HTML 파싱/마크다운 변환을 이벤트 루프 밖의 프로세스 풀에서 실행한다.
+
+    workers가 0이면 풀 없이 현재 루프에서 바로 실행한다.
+    작업 함수는 피클링 가능한 최상위/정적 함수여야 하고, 인자로는 응답 bytes를 넘긴다.
+    """
+
+    _instance = None
+
+    def __init__(self, workers):
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(max_workers=workers) if workers > 0 else None
+        self.tasks = 0
+
+    @classmethod
+    def get(cls):
+        if cls._instance is None:
+            workers = Setting.PARSE_WORKERS
+            cls._instance = cls((os.cpu_count() or 1) if workers == "auto" else int(workers))
+        return cls._instance
+
+    @classmethod
+    def shutdown(cls):
+        if cls._instance is not None and cls._instance.executor is not None:
+            cls._instance.executor.shutdown(wait=True, cancel_futures=True)
+        cls._instance = None
+
+    async def run(self, fn, *args):
+        self.tasks += 1
+        if self.executor is None:
+            return fn(*args)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
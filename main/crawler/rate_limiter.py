@@ -0,0 +1,73 @@
+import asyncio
+import time
+from urllib.parse import urlsplit
+from config.setting import Setting
+
+
+class TokenBucket:
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+        self.acquired_count = 0
+        self.waited_seconds = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        # 락을 쥔 채로 대기해서 대기자들이 FIFO 순서로 토큰을 받는다
+        async with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                wait_time = (1 - self.tokens) / self.rate
+                self.waited_seconds += wait_time
+                await asyncio.sleep(wait_time)
+                self._refill()
+            self.tokens -= 1
+            self.acquired_count += 1
+
+    def backlogged(self):
+        # 누가 토큰을 기다리는 중이거나 지금 바로 쓸 토큰이 없으면 밀려 있는 상태
+        self._refill()
+        return self._lock.locked() or self.tokens < 1
+
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷. 모든 크롤러 인스턴스와 요청 종류가 같은 버킷을 공유한다."""
+
+    _buckets = {}
+    _overrides = {}
+
+    @classmethod
+    def configure(cls, host, rate, burst):
+        cls._overrides[host] = (rate, burst)
+        cls._buckets.pop(host, None)
+
+    @classmethod
+    def get_bucket(cls, host):
+        if host not in cls._buckets:
+            rate, burst = cls._overrides.get(host, (Setting.RATE_LIMIT_PER_SEC, Setting.RATE_LIMIT_BURST))
+            cls._buckets[host] = TokenBucket(rate, burst)
+        return cls._buckets[host]
+
+    @classmethod
+    async def acquire(cls, url):
+        await cls.get_bucket(urlsplit(str(url)).hostname).acquire()
+
+    @classmethod
+    def backlogged(cls, url):
+        return cls.get_bucket(urlsplit(str(url)).hostname).backlogged()
+
+    @classmethod
+    def stats(cls):
+        return {
+            host: {"rate": bucket.rate, "burst": bucket.capacity,
+                   "acquired": bucket.acquired_count, "waited": round(bucket.waited_seconds, 2)}
+            for host, bucket in cls._buckets.items()
+        }
@@ -0,0 +1,70 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+import httpx
+
+
+class RetryExhaustedError(Exception):
+    """429/5xx/네트워크 오류로 재시도를 모두 쓴 요청. 삭제된 공고처럼 데이터가 없는 경우(None)와 구분한다."""
+
+    def __init__(self, platform, url, attempts, error):
+        self.platform = platform
+        self.url = url
+        self.attempts = attempts
+        self.error = error
+        super().__init__(f"{platform} 요청 재시도 {attempts}회 모두 실패 ({error}): {url}")
+
+
+class RetryPolicy:
+    """재시도 정책. 429/5xx는 백오프 후 재시도하고, 302/404/410은 삭제된 공고로 보고 즉시 포기한다.
+
+    공고 상세/요약 엔드포인트는 삭제되거나 검수 중인 공고에 503을 주므로
+    posting_gone_statuses를 넘겨 503도 재시도 없이 포기한다.
+    """
+
+    RETRYABLE_EXCEPTIONS = (httpx.TimeoutException, httpx.RemoteProtocolError, httpx.ConnectError, httpx.ReadError)
+
+    def __init__(self, max_attempts=5, base_delay=1.0, max_delay=32.0, deadline=120.0,
+                 retry_statuses=(429, 500, 502, 503, 504), gone_statuses=(302, 404, 410),
+                 posting_gone_statuses=(302, 404, 410, 503), min_attempt_timeout=1.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+        self.gone_statuses = frozenset(gone_statuses)
+        self.posting_gone_statuses = frozenset(posting_gone_statuses)
+        self.min_attempt_timeout = min_attempt_timeout
+
+    def is_retryable_status(self, status_code, gone_statuses=None):
+        return status_code in self.retry_statuses and not self.is_gone_status(status_code, gone_statuses)
+
+    def is_gone_status(self, status_code, gone_statuses=None):
+        return status_code in (self.gone_statuses if gone_statuses is None else gone_statuses)
+
+    def attempt_timeout(self, timeout, remaining):
+        # 진행 중인 시도가 deadline을 넘기지 않도록 단계별 타임아웃을 남은 시간으로 자른다
+        remaining = max(remaining, self.min_attempt_timeout)
+        cap = lambda value: remaining if value is None else min(value, remaining)
+        return httpx.Timeout(connect=cap(timeout.connect), read=cap(timeout.read),
+                             write=cap(timeout.write), pool=cap(timeout.pool))
+
+    def backoff(self, attempt, retry_after=None):
+        # equal jitter: 지수 백오프의 절반은 보장하고 나머지 절반만 무작위
+        delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+        delay = delay / 2 + random.uniform(0, delay / 2)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value):
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
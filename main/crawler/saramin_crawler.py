@@ -1,17 +1,60 @@
 from .base_crawler import BaseCrawler
 import time
 import asyncio
-import json
+from utils import json_codec
 import pprint
-from bs4 import BeautifulSoup
-import html2text
-import re
-import emoji
+from parsing import IMAGE, get_classifier, parse_html, render_markdown, sanitize_detail, section_filter
+from parsing.schema import Field, LabeledFields, Schema, attr, first_string, joined_strings
 from utils.logger import setup_logger
 
+# 요약 카드에서 읽는 부분만 파싱한다. 복리후생/근무지위치/기업정보는 h2 제목 + 다음 형제 블록으로 남긴다
+SUMMARY_SECTIONS = [
+    ("div", {"class": "page_notification"}),
+    (None, {"class": "corp_name"}),
+    ("button", {"id": "favorCompanyBtn"}),
+    ("h1", {"class": "subject"}),
+    ("dl", {"class": "list_summary"}),
+    ("dl", {"class": "recruit_end_date"}),
+    ("section", {"data-layer": "relatetags"}),
+]
+
+SUMMARY_SCHEMA = Schema({
+    "is_active": Field("div.page_notification.closed_job", extract=lambda element: False, default=True),
+    "company_name": Field(".corp_name"),
+    "csn": Field("button#favorCompanyBtn", attr("csn")),
+    "position": Field("h1.subject"),
+    "employment_type": Field("dl.list_summary dd.type", joined_strings),
+    "career": Field("dl.list_summary dd.experience", joined_strings),
+    "education": Field("dl.list_summary dd.education", joined_strings),
+    "deadline": Field("dl.recruit_end_date > dt.tag.end + dd", first_string),
+})
+
+# "기업정보" 제목 다음 블록
+SUMMARY_COMPANY_FIELDS = LabeledFields("div.detail_corp > dl", "dt", "dd", {
+    "기업형태": ("classification", Field(extract=first_string)),
+    "사원수": ("employees", Field(extract=first_string, post=lambda value: value.replace("명", ""))),
+    "설립일": ("foundation_date", Field(extract=first_string)),
+    "주소": ("address", Field(extract=first_string)),
+})
+
+COMPANY_SCHEMA = Schema({
+    "company_logo_url": Field("div.common_company_info > div.company_logo > img", attr("src")),
+    "company_name": Field("div.common_company_info > .company_name"),
+    "industry": Field("div.common_company_info > .industry"),
+    "introduction": Field("div.introduce_txt_box"),
+    "summary": LabeledFields("div.tab_company_summary > ul > li", "div.summary_label", "div.summary_value", {
+        "기업형태": ("classification", Field(".box_align", first_string)),
+        "사원수": ("employees", Field(".box_align", first_string, post=lambda value: value.replace("명", "").strip())),
+        "설립일": ("foundation_date", Field(".txt_desc", post=lambda value: value.replace("설립", "").strip())),
+        "주소": ("address", Field(".addr")),
+    }),
+})
+
 class SaraminCrawler(BaseCrawler):
-    def __init__(self, logger, k=5):
-        super().__init__(base_url="https://www.saramin.co.kr", platform="Saramin", logger=logger, k=k)
+    # 공고마다 www(상세)와 m(요약) 두 호스트를 번갈아 쓰므로 유휴 연결을 넉넉히 둔다
+    def __init__(self, logger, k=5, max_k=20, http2=True, keepalive_connections=20):
+        super().__init__(base_url="https://www.saramin.co.kr", platform="Saramin", logger=logger, k=k, max_k=max_k,
+                         http2=http2, keepalive_connections=keepalive_connections)
         self.job_list_url = self.base_url + "/zf_user/jobs/list/job-category"
         self.job_detail_url = "https://www.saramin.co.kr/zf_user/jobs/relay/view-detail" # "https://m.saramin.co.kr/job-search/view-frame" # 모바일 데이터 로딩 X
         self.job_summary_url = "https://m.saramin.co.kr/job-search/view-card" # https://www.saramin.co.kr/zf_user/jobs/relay/view-ajax POST rec_idx 52323189
@@ -29,63 +72,37 @@ class SaraminCrawler(BaseCrawler):
         
     async def fetch_job_list(self):
         url = "https://m.saramin.co.kr/search/get-recruit-list"
-        response = await self.request("GET", url, headers=self.header, params=self.payload)
-        json_data = response.json()
+        response = await self.request("GET", url, headers=self.header, params=self.payload, max_bytes=self.max_body_bytes["list"])
+        json_data = json_codec.response_json(response)
         return_data = json_data["innerHTML"]
 
-        soup = BeautifulSoup(return_data, "html.parser")
+        soup = parse_html(return_data)
         recruit_items = soup.select('.recruit_container')
         rec_indices = [item.get('data-rec_idx') for item in recruit_items]
 
         return rec_indices
 
+    async def request_job_detail(self, rec_idx):
+        return await self.request("POST", self.job_detail_url, headers=self.header, data={"rec_idx": rec_idx},
+                                  gone_statuses=self.retry_policy.posting_gone_statuses, max_bytes=self.max_body_bytes["detail"])
+
     async def fetch_job_detail(self, rec_idx):
-        response = await self.request("POST", self.job_detail_url, headers=self.header, data={"rec_idx": rec_idx})
+        return await self.parse_detail_response(await self.request_job_detail(rec_idx))
+
+    async def parse_detail_response(self, response):
         if response is None:
             return None
-        html_content = response.text
-        soup = BeautifulSoup(html_content, 'html.parser')
-
-        for element in soup(["script", "style", "noscript"]):
-            element.extract()
-
-        images = [f'https:{img.get("src")}' if img.get("src").startswith("//") else img.get("src") for img in soup.find_all('img')]
-        has_image = len(images) > 0
-
-        for tag in soup.find_all('p', attrs={'hidden': True}):
-            tag.decompose()
-    
-        hidden_style_pattern = re.compile(r'(font-size:\s*0|height:\s*0|width:\s*0|display:\s*none|visibility:\s*hidden)', re.IGNORECASE)
-        hidden_tags = soup.find_all(attrs={"style": hidden_style_pattern})
-        for tag in hidden_tags:
-            tag.decompose()
+        detail = await self.run_parser(SaraminCrawler.parse_job_detail, response, self.keyword)
+        if detail["content_type"] == IMAGE:
+            self.logger.info(f"⚠️  본문이 짧거나 핵심 키워드가 없어 이미지 공고로 판단합니다.")
+        return detail
 
-        blind_tags = soup.find_all(class_=re.compile(r'(blind|hidden|sr-only)'))
-        for tag in blind_tags:
-            tag.decompose()
+    @staticmethod
+    def parse_job_detail(content, encoding, keywords):
+        soup, clean_text, images = sanitize_detail(parse_html(content, encoding))
+        content_type, _ = get_classifier(keywords).classify(clean_text, has_image=len(images) > 0)
 
-        clean_text = soup.get_text(separator=' ', strip=True)
-        text_length = len(clean_text)
-
-        has_keyword = any(keyword in clean_text for keyword in self.keyword)
-        has_emoji = len(emoji.emoji_list(clean_text)) > 0
-
-        content_type = "text"
-
-        if text_length < 200:
-            content_type = "image" if has_image else "text"
-        
-        if not has_keyword and has_image:
-            if has_emoji:
-                content_type = "text"
-            self.logger.info(f"⚠️  텍스트는 길지만 핵심 키워드가 없어 IMAGE 공고로 판단합니다.")
-            content_type = "IMAGE"
-
-        h = html2text.HTML2Text()
-        h.ignore_links = False
-        h.ignore_images = True
-        h.body_width = 0
-        markdown_text = h.handle(str(soup))
+        markdown_text = render_markdown(soup)
 
         return {
             "content_type": content_type,
@@ -93,30 +110,28 @@ class SaraminCrawler(BaseCrawler):
             "images": images
         }
     
-    async def fetch_job_summary(self, rec_idx):
-        self.header.update({"Referer": f"https://m.saramin.co.kr/job-search/view?rec_idx={rec_idx}"})
-        response = await self.request("POST", self.job_summary_url, headers=self.header, data={"rec_idx": rec_idx})
+    async def request_job_summary(self, rec_idx):
+        # 공고마다 Referer가 다르고 요청이 동시에 나가므로 공용 헤더를 건드리지 않고 복사본을 쓴다
+        headers = {**self.header, "Referer": f"https://m.saramin.co.kr/job-search/view?rec_idx={rec_idx}"}
+        return await self.request("POST", self.job_summary_url, headers=headers, data={"rec_idx": rec_idx},
+                                  gone_statuses=self.retry_policy.posting_gone_statuses, max_bytes=self.max_body_bytes["summary"])
 
-        json_data = response.json()
-        return_data = json_data["returnData"]
-        
-        soup = BeautifulSoup(return_data, "html.parser")
+    async def fetch_job_summary(self, rec_idx):
+        return await self.parse_summary_response(await self.request_job_summary(rec_idx), rec_idx)
 
-        pretty_html = soup.prettify()
+    async def parse_summary_response(self, response, rec_idx):
+        if response is None:
+            return None
+        return await self.run_parser(SaraminCrawler.parse_job_summary, response, rec_idx)
 
-        is_active = not soup.select('div.page_notification.closed_job')
+    @staticmethod
+    def parse_job_summary(content, encoding, rec_idx):
+        json_data = json_codec.loads(content)
+        return_data = json_data["returnData"]
         
-        company_tag = soup.select_one('.corp_name')
-        company_name = company_tag.text.strip()
-        csn = soup.select_one('button#favorCompanyBtn').get('csn')
-
-        position = soup.select_one('h1.subject').text.strip()
+        soup = parse_html(return_data, parse_only=section_filter(SUMMARY_SECTIONS, heading_tags=("h2",)))
 
-        basic_info = soup.select_one('dl.list_summary')
-        employment_type = " ".join(basic_info.select_one('dd.type').stripped_strings).strip()
-        career = " ".join(basic_info.select_one('dd.experience').stripped_strings).strip()
-        education = " ".join(basic_info.select_one('dd.education').stripped_strings).strip()
-        deadline = soup.select_one('dl.recruit_end_date > dt.tag.end + dd').contents[0].strip()
+        summary = SUMMARY_SCHEMA.extract(soup)
 
         has_benefits = soup.find("h2", string=lambda text: text and "복리후생" in text)
         if has_benefits:
@@ -143,22 +158,11 @@ class SaraminCrawler(BaseCrawler):
 
         has_company_info = soup.find("h2", string=lambda text: text and "기업정보" in text)
         if has_company_info:
-            company_info_list = has_company_info.find_next_sibling().select('div.detail_corp > dl')
-            company_info = dict()
-            for corp_info in company_info_list:
-                key = corp_info.select_one('dt').text.strip()
-                value = corp_info.select_one('dd').contents[0].strip()
-                if key == "기업형태":
-                    company_info.update({"classification": value})
-                if key == "사원수":
-                    company_info.update({"employees": value.replace("명","")})
-                if key == "설립일":
-                    company_info.update({"foundation_date": value})
-                if key == "주소":
-                    company_info.update({"address": value})
+            csn = summary["csn"]
+            company_info = SUMMARY_COMPANY_FIELDS(has_company_info.find_next_sibling())
             company_info.update({
                 "csn": csn,
-                "company_name": company_name,
+                "company_name": summary["company_name"],
                 "company_url": f"https://m.saramin.co.kr/job-search/company-info-view?csn={csn}"
             })
 
@@ -170,61 +174,51 @@ class SaraminCrawler(BaseCrawler):
         return {
             "rec_idx": rec_idx,
             "job_url": f"https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx={rec_idx}",
-            "position": position,
-            "is_active": bool(is_active),
-            "deadline": deadline,
+            "position": summary["position"],
+            "is_active": summary["is_active"],
+            "deadline": summary["deadline"],
             "csn": company_info.get("csn") if has_company_info else None,
             "company_info": company_info if has_company_info else None,
-            "employment_type": employment_type,
-            "career": career,
-            "education": education,
+            "employment_type": summary["employment_type"],
+            "career": summary["career"],
+            "education": summary["education"],
             "benefits": benefits if has_benefits else None,
             "related_tags": related_tags if has_related_tags else None,
             "address": address.split('\n')[0] if has_address else None,
         }
 
-    async def fetch_company_info(self, company_url):
-        response = await self.request('GET', company_url)
-        if response is None:
+    async def fetch_job_pages(self, rec_idx):
+        # 공고를 이루는 원본 응답만 먼저 받아 두고 파싱은 parse_job_pages에서 한다
+        # 요약과 상세는 서로 의존하지 않으므로 동시에 요청한다
+        summary_response, detail_response = await asyncio.gather(
+            self.request_job_summary(rec_idx),
+            self.request_job_detail(rec_idx),
+        )
+        if summary_response is None or detail_response is None:
             return None
-        html_content = response.text
-        soup = BeautifulSoup(html_content, 'html.parser')
+        return {"summary": summary_response, "detail": detail_response}
 
-        if has_company_logo := soup.select_one('div.common_company_info > div.company_logo > img'):
-            company_logo_url = has_company_logo.get('src')
-        if has_company_name := soup.select_one('div.common_company_info > .company_name'):
-            company_name = has_company_name.text.strip()
-        if has_industry := soup.select_one('div.common_company_info > .industry'):
-            industry = has_industry.text.strip()
+    async def parse_job_pages(self, rec_idx, pages):
+        return await asyncio.gather(
+            self.parse_summary_response(pages["summary"], rec_idx),
+            self.parse_detail_response(pages["detail"]),
+        )
+
+    async def fetch_company_info(self, company_url):
+        return await self.fetch_cached(company_url, lambda response: self.run_parser(SaraminCrawler.parse_company_info, response, company_url),
+                                       max_bytes=self.max_body_bytes["company"])
+
+    @staticmethod
+    def parse_company_info(content, encoding, company_url):
+        soup = parse_html(content, encoding)
 
-        company_info = dict()
-        for item in soup.select('div.tab_company_summary > ul > li'):
-            key = item.select_one('div.summary_label').text.strip()
-            value = item.select_one('div.summary_value')
-            if key == '기업형태':
-                company_info.update({'classification': value.select_one('.box_align').contents[0].strip()})
-            if key == '사원수':
-                company_info.update({'employees': value.select_one('.box_align').contents[0].replace("명","").strip()})
-            if key == '설립일':
-                company_info.update({'foundation_date': value.select_one('.txt_desc').text.replace("설립","").strip()})
-            if key == '주소':
-                company_info.update({'address': value.select_one('.addr').text.strip()})
-
-        if has_intro := soup.select_one('div.introduce_txt_box'):
-            introduction = has_intro.text.strip()
-        
         return {
             "company_url": company_url,
-            "company_logo_url": company_logo_url if has_company_logo else None,
-            "company_name": company_name,
-            "industry": industry if has_industry else None,
-            "introduction": introduction if has_intro else None,
-            **company_info
+            **COMPANY_SCHEMA.extract(soup)
         }
 
     async def fetch_job(self, gno):
-        job_summaray = await self.fetch_job_summary(gno)
-        detail_contents = await self.fetch_job_detail(gno)
+        job_summaray, detail_contents = await asyncio.gather(self.fetch_job_summary(gno), self.fetch_job_detail(gno))
 
         company_info = dict()
         if job_summaray["company_info"]:
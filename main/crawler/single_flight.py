@@ -0,0 +1,25 @@
+import asyncio
+
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 호출을 하나의 작업으로 합친다."""
+
+    def __init__(self):
+        self.in_flight = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key, fn):
+        self.calls += 1
+        if (future := self.in_flight.get(key)) is not None:
+            self.shared += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(fn())
+        self.in_flight[key] = future
+        future.add_done_callback(lambda _: self.in_flight.pop(key, None))
+        # 먼저 온 호출자가 취소돼도 뒤에 기다리는 호출자 몫의 작업은 계속 진행한다
+        return await asyncio.shield(future)
+
+    def stats(self):
+        return {"calls": self.calls, "shared": self.shared}
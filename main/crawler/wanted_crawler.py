@@ -1,13 +1,17 @@
 from .base_crawler import BaseCrawler
+from .circuit_breaker import CircuitOpenError
+from .retry import RetryExhaustedError
 import time
 import asyncio
-import json
+from utils import json_codec
 import pprint
 from utils.logger import setup_logger
 
 class WantedCrawler(BaseCrawler):
-    def __init__(self, logger, k=5):
-        super().__init__(base_url="https://www.wanted.co.kr", platform="Wanted", logger=logger, k=k)
+    # 공고당 상세 요청 하나뿐이고 회사 정보(insight)는 캐시로 대부분 건너뛰어 유휴 연결을 적게 둔다
+    def __init__(self, logger, k=5, max_k=20, http2=True, keepalive_connections=8):
+        super().__init__(base_url="https://www.wanted.co.kr", platform="Wanted", logger=logger, k=k, max_k=max_k,
+                         http2=http2, keepalive_connections=keepalive_connections)
         self.job_list_url = self.base_url + "/api/chaos/navigation/v1/results"
         self.job_detail_url = self.base_url + "/api/chaos/jobs/v4"
         self.company_url = "https://insight.wanted.co.kr/api"
@@ -23,16 +27,34 @@ class WantedCrawler(BaseCrawler):
         self.logger = logger.getChild("Wanted")
 
     async def fetch_job_list(self):
-        job_list_response = await self.request('GET', self.job_list_url, headers=self.header, params=self.payload)
-        job_ids = [job['id'] for job in job_list_response.json()["data"]]
+        job_list_response = await self.request('GET', self.job_list_url, headers=self.header, params=self.payload, max_bytes=self.max_body_bytes["list"])
+        job_ids = [job['id'] for job in json_codec.response_json(job_list_response)["data"]]
         return job_ids
     
+    async def request_job_detail(self, job_id):
+        job_url = f"{self.job_detail_url}/{job_id}/details"
+        return await self.request('GET', job_url, hedge="job_detail", gone_statuses=self.retry_policy.posting_gone_statuses,
+                                  max_bytes=self.max_body_bytes["detail"])
+
     async def fetch_job_detail(self, job_id):
+        return self.parse_detail_response(await self.request_job_detail(job_id), job_id)
+
+    def parse_detail_response(self, job_detail_response, job_id):
+        if job_detail_response is None:
+            return None
         job_url = f"{self.job_detail_url}/{job_id}/details"
-        job_detail_response = await self.request('GET', job_url)
-        job_detail_data = self.parse_job_data(job_detail_response.json(), job_url)
+        job_detail_data = self.parse_job_data(json_codec.response_json(job_detail_response), job_url)
         return job_detail_data
 
+    async def fetch_job_pages(self, job_id):
+        job_detail_response = await self.request_job_detail(job_id)
+        if job_detail_response is None:
+            return None
+        return {"detail": job_detail_response}
+
+    async def parse_job_pages(self, job_id, pages):
+        return self.parse_detail_response(pages["detail"], job_id)
+
     def parse_job_data(self, details_json, url):
         try:
             if details_json.get('error') is None and details_json.get("message") == "ok":
@@ -67,19 +89,27 @@ class WantedCrawler(BaseCrawler):
     async def fetch_company_info(self, company_id):
         try:
             company_url = f"{self.company_url}/company/{company_id}/info-for-wanted"
-            company_info_response = await self.request('GET', company_url)
-            company_info_data = self.parse_company_data(company_info_response.json(), company_url)
+            company_info_data = await self.fetch_cached(company_url, lambda response: self.parse_company_data(json_codec.response_json(response), company_url),
+                                                        max_bytes=self.max_body_bytes["company"])
             if company_info_data.get('reg_no_hash'):
-                employee_info_response = await self.request('GET', f"{self.company_url}/wanted/{company_info_data.get('reg_no_hash')}/employees")
-                employees_info_data = employee_info_response.json()
-                if employee_info := employees_info_data.get('employees'):
-                    employees = employee_info.get(employees_info_data.get('defaultSource')).get('employee')
-                    company_info_data['employees'] = employees
+                employees = await self.fetch_cached(f"{self.company_url}/wanted/{company_info_data.get('reg_no_hash')}/employees", self.parse_employees,
+                                                    max_bytes=self.max_body_bytes["company"])
+                if employees is not None:
+                    company_info_data = {**company_info_data, 'employees': employees}
+        except (CircuitOpenError, RetryExhaustedError):
+            # 서킷/재시도 소진은 "회사 정보 없음"이 아니므로 파이프라인(CircuitGate)까지 올린다
+            raise
         except Exception as e:
             self.logger.error(f"⚠️  파싱 중 에러 (ID: {company_id}): {e}")
             return None
         return company_info_data
 
+    def parse_employees(self, response):
+        employees_info_data = json_codec.response_json(response)
+        if employee_info := employees_info_data.get('employees'):
+            return employee_info.get(employees_info_data.get('defaultSource')).get('employee')
+        return None
+
     def parse_company_data(self, data_json, company_url):
         try:
             if data_json.get('error') and data_json.get("message") == "Item Not Found":
@@ -1,5 +1,5 @@
+import argparse
 import asyncio
-import random
 import logging
 import sys
 import os
@@ -7,13 +7,68 @@ from utils.logger import setup_logger
 from crawler.wanted_crawler import WantedCrawler
 from crawler.saramin_crawler import SaraminCrawler
 from crawler.jobkorea_crawler import JobkoreaCrawler
+from crawler.rate_limiter import HostRateLimiter
+from crawler.circuit_breaker import CircuitOpenError
+from crawler.retry import RetryExhaustedError
+from crawler.parse_pool import ParsePool
+from crawler.content_hash import content_hash
+from crawler.company_resolver import CompanyResolver
+from config.setting import Setting
 from database.connection import get_session_factory
-from repository import RepositoryFactory
+from repository import RepositoryFactory, CrawlStateRepository
 from repository.nosql import NoSQLRepository
+from utils.pipeline import Pipeline, Stage
+from utils.checkpoint import CrawlCheckpoint
 from collections import Counter
 
+# 갱신 대상이지만 원본 응답이 지난번과 같아 파싱 없이 수집 시각만 갱신할 공고
+UNCHANGED = object()
 
-async def run_crawler_task(platform_name, crawler_instance, logger, nosql_repository, max_page_count=100):
+
+async def pause_for_circuit(crawler, logger, error):
+    wait_time = max(error.retry_after, crawler.breaker.remaining(), 1.0)
+    logger.warning(f"⏸️ 서킷 OPEN으로 플랫폼 일시 정지 ({wait_time:.0f}초). 다른 플랫폼은 계속 진행합니다.")
+    await asyncio.sleep(wait_time)
+
+
+class CircuitGate:
+    """여러 워커가 동시에 서킷 OPEN을 만나도 한 번만 쉬고, 쉰 횟수가 한도를 넘으면 더 기다리지 않는다."""
+
+    def __init__(self, crawler, logger, max_pauses):
+        self.crawler = crawler
+        self.logger = logger
+        self.max_pauses = max_pauses
+        self.pauses = 0
+        self.exhausted = False
+        self.lock = asyncio.Lock()
+
+    async def call(self, fn, *args):
+        while True:
+            try:
+                return await fn(*args)
+            except CircuitOpenError as e:
+                if not await self.wait(e):
+                    raise
+
+    async def wait(self, error):
+        seen = self.pauses
+        async with self.lock:
+            if self.exhausted:
+                return False
+            # 기다리는 동안 다른 워커가 이미 쉬고 왔으면 바로 재시도한다
+            if self.pauses != seen:
+                return True
+            if self.pauses >= self.max_pauses:
+                self.exhausted = True
+                self.logger.error(f"⛔ 서킷이 {self.max_pauses}회 이상 열려 플랫폼 수집을 중단합니다.")
+                return False
+            self.pauses += 1
+            await pause_for_circuit(self.crawler, self.logger, error)
+            return True
+
+
+async def run_crawler_task(platform_name, crawler_instance, logger, nosql_repository, max_page_count=100, max_circuit_pauses=5,
+                           overlap_pages=2, resume=False):
     logger = logger.getChild(platform_name)
     SessionFactory = get_session_factory()
     session = SessionFactory()
@@ -21,6 +76,7 @@ async def run_crawler_task(platform_name, crawler_instance, logger, nosql_reposi
     try:
         child_logger = logger.getChild("Repository")
         repository = RepositoryFactory.get_repository(platform_name, session, child_logger)
+        state_repository = CrawlStateRepository(session, child_logger)
     except ValueError as e:
         logger.error(f"리포지토리 생성 실패: {e}")
         session.close()
@@ -28,91 +84,242 @@ async def run_crawler_task(platform_name, crawler_instance, logger, nosql_reposi
 
     logger.info(f"🚀 크롤링 시작")
 
-    total_saved = 0
-    pass_page_count = 0 
+    totals = Counter()
+    seen_ids = set()
+    # 목록은 최신순이므로 지난 실행에서 모두 처리한 공고 id(워터마크) 아래로 내려가 더 수집할 공고가 없으면 멈춘다
+    watermark = state_repository.get_watermark(platform_name)
+    # 지난 실행들에서 워터마크를 묶었던 공고 id별 연속 실패 횟수
+    held_ids = state_repository.get_held_ids(platform_name)
+    newest_id = None
+    # 이번 실행에서 받지 못하고 건너뛴 공고. 다음 실행에서 다시 보도록 워터마크를 이 아래로 묶는다
+    dropped_ids = set()
+    # 회사 신선도 확인과 회사 정보 수집은 이번 실행 전체에서 공유한다
+    companies = CompanyResolver(lambda company_ids: repository.need_companies_crawling(company_ids, expire_days=7))
+    checkpoint = CrawlCheckpoint(os.path.join(Setting.CRAWL_CHECKPOINT_DIR, f"{platform_name.lower()}.json"))
+    cursor_key = "offset" if platform_name == "WANTED" else "page"
+    resume_ids = []
+    list_interrupted = False
     limit = 20
 
     try:
         async with crawler_instance as crawler:
-            while True:
-                current_page_info = crawler.payload.get('offset', crawler.payload.get('page', 0))
-                logger.info(f"📄 목록 조회 중... (Index: {current_page_info})")
-
-                job_ids = await crawler.fetch_job_list()
-                crawler_ids = [str(job_id) for job_id in job_ids]
-                
-                if not job_ids:
-                    logger.info(f"✅ 더 이상 공고가 없습니다. 종료.")
-                    break
-
-                need_crawling_flags = [repository.need_job_crawling(job_id, expire_days=7) for job_id in job_ids]
-                
+            gate = CircuitGate(crawler, logger, max_circuit_pauses)
+            if resume and checkpoint.load(max_age=Setting.CRAWL_CHECKPOINT_MAX_AGE_HOURS * 3600):
+                crawler.payload[cursor_key] = checkpoint.cursor
+                newest_id = checkpoint.newest_id
+                resume_ids = checkpoint.retry_ids()
+                logger.info(f"⏯️ 체크포인트에서 이어서 수집합니다. (Index: {checkpoint.cursor}, 다시 처리할 공고: {len(resume_ids)}건)")
+            elif resume and checkpoint.saved_at is not None:
+                logger.warning(f"⏯️ 체크포인트가 {Setting.CRAWL_CHECKPOINT_MAX_AGE_HOURS:g}시간보다 오래되어 무시하고 처음부터 수집합니다.")
+            checkpoint.cursor = crawler.payload[cursor_key]
+
+            async def discover(_, emit):
+                nonlocal newest_id, list_interrupted
+                # 지난 실행에서 커밋 전에 멈춘 공고부터 처리한다
+                if resume_ids:
+                    await emit(resume_ids)
+                while not pipeline.stopped.is_set():
+                    current_page_info = crawler.payload.get('offset', crawler.payload.get('page', 0))
+                    logger.info(f"📄 목록 조회 중... (Index: {current_page_info})")
+
+                    try:
+                        job_ids = await gate.call(crawler.fetch_job_list)
+                    except CircuitOpenError:
+                        break
+                    except RetryExhaustedError:
+                        # 커서는 이 페이지에 머물러 있으므로 체크포인트를 남겨 다음 실행에서 이어 간다
+                        logger.error(f"⛔ 목록 조회가 계속 실패해 목록 수집을 중단합니다. (Index: {current_page_info})")
+                        list_interrupted = True
+                        break
+
+                    if not job_ids:
+                        logger.info(f"✅ 더 이상 공고가 없습니다. 종료.")
+                        break
+
+                    newest_id = max(newest_id or 0, max(int(job_id) for job_id in job_ids))
+                    checkpoint.add(job_ids)
+                    await emit(job_ids)
+
+                    if platform_name == "WANTED":
+                        crawler.payload["offset"] += limit
+                    else:
+                        crawler.payload["page"] += 1
+                    checkpoint.cursor = crawler.payload[cursor_key]
+                    checkpoint.newest_id = newest_id
+
+            async def filter_fresh(job_ids, emit):
+                # 앞 페이지가 아직 저장 전일 수 있으므로 이번 실행에서 이미 넘긴 공고는 다시 보지 않는다
+                need_crawling_flags = ["pass" if str(job_id) in seen_ids else repository.need_job_crawling(job_id, expire_days=7)
+                                       for job_id in job_ids]
+                seen_ids.update(str(job_id) for job_id in job_ids)
+
                 target_ids = [job_id for job_id, flag in zip(job_ids, need_crawling_flags) if flag in ("new", "renew")]
-                target_count = len(target_ids)
+                for job_id, flag in zip(job_ids, need_crawling_flags):
+                    if flag == "pass":
+                        checkpoint.done(job_id)
 
                 counter = Counter(need_crawling_flags)
-                logger.info(f"조회: {len(job_ids)}건 | 신규: {counter["new"]}건 | 패스: {counter["pass"]}건 | 갱신: {counter["renew"]}")
+                logger.info(f"조회: {len(job_ids)}건 | 신규: {counter['new']}건 | 패스: {counter['pass']}건 | 갱신: {counter['renew']}")
 
-                if target_count == 0:
-                    pass_page_count += 1
-                    if pass_page_count >= max_page_count:
-                        logger.warning(f"⛔ {max_page_count} 페이지 이상 연속 중복 발생으로 최신 공고 수집 완료 간주.")
-                        break
+                # 워터마크 아래라도 신규/갱신 대상이 남은 페이지는 멈출 근거로 세지 않는다.
+                # 끌어올린 공고 등으로 순서가 조금 섞일 수 있어 대상 없는 페이지가 overlap_pages개를 넘게 이어져야 멈춘다
+                if watermark is not None and not target_ids and max(int(job_id) for job_id in job_ids) <= watermark:
+                    totals["old_pages"] += 1
+                    if totals["old_pages"] > overlap_pages and not pipeline.stopped.is_set():
+                        logger.info(f"🔖 워터마크({watermark}) 이하에서 수집할 공고가 없는 페이지가 {totals['old_pages']}개 이어져 "
+                                    f"이미 수집한 구간으로 보고 종료.")
+                        pipeline.stop()
                 else:
-                    pass_page_count = 0
+                    totals["old_pages"] = 0
+
+                if not target_ids:
+                    totals["pass_pages"] += 1
+                    if totals["pass_pages"] >= max_page_count:
+                        logger.warning(f"⛔ {max_page_count} 페이지 이상 연속 중복 발생으로 최신 공고 수집 완료 간주.")
+                        pipeline.stop()
+                    return
+                totals["pass_pages"] = 0
+
+                renew_ids = [job_id for job_id, flag in zip(job_ids, need_crawling_flags) if flag == "renew"]
+                known_hashes = repository.get_content_hashes(renew_ids)
+                for target_id in target_ids:
+                    await emit((target_id, known_hashes.get(str(target_id))))
+
+            async def fetch(item, emit):
+                target_id, known_hash = item
+                try:
+                    pages = await gate.call(crawler.fetch_job_pages, target_id)
+                except CircuitOpenError:
+                    checkpoint.fail(target_id)
+                    pipeline.stop()
+                    return
+                except RetryExhaustedError:
+                    # 재시도를 다 쓴 공고는 실패로 남기고 다음 공고로 넘어간다
+                    checkpoint.fail(target_id)
+                    return
+                if pages is None:
+                    checkpoint.done(target_id)
+                    dropped_ids.add(int(target_id))
+                    return
+                page_hash = content_hash(pages)
+                await emit((target_id, UNCHANGED if known_hash == page_hash else pages, page_hash))
 
-                if target_ids:
-                    tasks = [process_single_job(platform_name, crawler, repository, target_id) for target_id in target_ids]
-                    results = await asyncio.gather(*tasks)
-                    job_details = [res for res in results if res is not None]
+            async def parse(item, emit):
+                target_id, pages, page_hash = item
+                if pages is UNCHANGED:
+                    await emit((target_id, UNCHANGED))
+                    return
+                try:
+                    data = await gate.call(process_single_job, platform_name, crawler, companies, target_id, pages, page_hash)
+                except CircuitOpenError:
+                    checkpoint.fail(target_id)
+                    pipeline.stop()
+                    return
+                except RetryExhaustedError:
+                    checkpoint.fail(target_id)
+                    return
+                if data is None:
+                    checkpoint.done(target_id)
+                    dropped_ids.add(int(target_id))
+                    return
+                await emit((target_id, data))
 
-                    logger.info(f"💾 DB 저장 중...")
-                    for job_data in job_details:
-                        repository.save_job(job_data)
-                    
+            async def persist(batch, emit):
+                # 저장부터 커밋까지 await 없이 처리해서 다른 단계의 조회와 섞이지 않게 한다
+                job_details = [data for _, data in batch if data is not UNCHANGED]
+                unchanged_ids = [target_id for target_id, data in batch if data is UNCHANGED]
+
+                for job_data in job_details:
+                    repository.save_job(job_data)
+                if unchanged_ids:
+                    repository.touch_jobs(unchanged_ids)
+                session.commit()
+                for target_id, _ in batch:
+                    checkpoint.done(target_id)
+                checkpoint.save()
+
+                totals["saved"] += len(job_details)
+                totals["unchanged"] += len(unchanged_ids)
+                logger.info(f"✅ {len(job_details)}건 저장 완료 (누적: {totals['saved']}건)"
+                            + (f" | ♻️ 본문 변경 없음 {len(unchanged_ids)}건은 수집 시각만 갱신" if unchanged_ids else ""))
+
+                for job_data in job_details:
+                    await emit(job_data.get("job"))
+
+            async def sink_raw(batch, emit):
+                nosql_results = await asyncio.to_thread(lambda: [nosql_repository.save_raw_job(platform_name, job) for job in batch])
+                nosql_success_count = sum(1 for result in nosql_results if result)
+                if nosql_success_count > 0:
+                    logger.info(f"☁️ OCI NoSQL {nosql_success_count}/{len(batch)}건 적재 완료")
+
+            batch_size = Setting.PIPELINE_BATCH_SIZE
+            pipeline = Pipeline([
+                Stage("discovery", discover, queue_size=1),
+                Stage("freshness", filter_fresh, queue_size=2),
+                Stage("fetch", fetch, workers=Setting.PIPELINE_FETCH_WORKERS or crawler.max_k),
+                Stage("parse", parse, workers=Setting.PIPELINE_PARSE_WORKERS),
+                Stage("persist", persist, queue_size=batch_size * 2, batch_size=batch_size, linger=1.0),
+                Stage("raw_sink", sink_raw, queue_size=batch_size * 2, batch_size=batch_size, linger=1.0),
+            ])
+            try:
+                await pipeline.run(None)
+                # 서킷 때문에 빠진 공고가 있으면 다음 실행에서 다시 보도록 워터마크를 올리지 않고,
+                # 실패하거나 건너뛴 공고가 있으면 그중 가장 작은 id 아래까지만 올린다
+                if not gate.exhausted and newest_id is not None:
+                    missed_ids = dropped_ids | {int(job_id) for job_id in checkpoint.unfinished()}
+                    # 매번 실패하는 공고 하나가 워터마크를 영영 붙잡지 않도록 연속으로 놓친 횟수에 상한을 둔다
+                    # 놓아준 공고도 횟수를 계속 남겨서 다음 실행에 다시 놓쳤을 때 워터마크를 또 묶지 않게 한다
+                    hold_runs = {job_id: held_ids.get(str(job_id), 0) + 1 for job_id in missed_ids}
+                    holding = [job_id for job_id, runs in hold_runs.items() if runs <= Setting.WATERMARK_HOLD_MAX_RUNS]
+                    released = sorted(job_id for job_id, runs in hold_runs.items() if runs > Setting.WATERMARK_HOLD_MAX_RUNS)
+                    if newly_released := [job_id for job_id in released if hold_runs[job_id] == Setting.WATERMARK_HOLD_MAX_RUNS + 1]:
+                        logger.warning(f"🔖 {Setting.WATERMARK_HOLD_MAX_RUNS}회 넘게 연속으로 놓친 공고 {len(newly_released)}건은 "
+                                       f"더 이상 워터마크를 묶지 않습니다. ({newly_released[:10]})")
+                    for job_id in released:
+                        checkpoint.done(job_id)
+                    new_watermark = min(newest_id, min(holding) - 1) if holding else newest_id
+                    state_repository.save_watermark(platform_name, max(new_watermark, watermark or 0),
+                                                    {str(job_id): runs for job_id, runs in hold_runs.items()})
                     session.commit()
-                    total_saved += len(job_details)
-                    logger.info(f"✅ {len(job_details)}건 저장 완료 (누적: {total_saved}건)")
-
-                    nosql_success_count = 0
-                    for job_data in job_details:
-                        if nosql_repository.save_raw_job(platform_name, job_data.get("job")):
-                            nosql_success_count += 1
-                    
-                    if nosql_success_count > 0:
-                        logger.info(f"☁️ OCI NoSQL {nosql_success_count}/{len(job_details)}건 적재 완료")
-
-                if platform_name == "WANTED":
-                    crawler.payload["offset"] += limit
+                    if new_watermark > (watermark or 0):
+                        logger.info(f"🔖 워터마크 갱신: {watermark} → {new_watermark}")
+                if gate.exhausted or list_interrupted or checkpoint.pending or checkpoint.failed:
+                    checkpoint.save()
+                    logger.warning(f"⏯️ 처리하지 못한 공고 {len(checkpoint.unfinished())}건을 체크포인트에 남겼습니다. "
+                                   f"--resume으로 이어서 수집할 수 있습니다.")
                 else:
-                    crawler.payload["page"] += 1
-                
-                sleep_time = random.uniform(3, 7)
-                await asyncio.sleep(sleep_time)
+                    checkpoint.clear()
+            finally:
+                logger.info("🧵 파이프라인 통계 | " + " | ".join(
+                    f"{name}: {stage['processed']}건 (워커 {stage['workers']}, 처리 {stage['busy']}s)"
+                    for name, stage in pipeline.stats().items()))
+                company_stats = companies.stats()
+                logger.info(f"🏢 회사 정보 | 확인 요청: {company_stats['calls']}건 | DB 조회: {company_stats['queries']}회 "
+                            f"(절약 {company_stats['saved_queries']}회) | 수집: {company_stats['fetched']}건 | "
+                            f"실행 내 재사용: {company_stats['reused']}건 (수집 절약 {company_stats['saved_fetches']}건)")
 
     except Exception as e:
         session.rollback()
         logger.error(f"🔥 에러 발생: {e}", exc_info=True)
     finally:
         session.close()
-        logger.info(f"🏁 종료 (총 {total_saved}건 저장)")
+        logger.info(f"🏁 종료 (총 {totals['saved']}건 저장, 변경 없음 {totals['unchanged']}건)")
+
+async def fetch_company_page(crawler, summary_company):
+    if company_url := summary_company["company_url"]:
+        return await crawler.fetch_company_info(company_url) or dict()
+    return dict()
 
-async def process_single_job(platform_name, crawler, repository, target_id):
+async def process_single_job(platform_name, crawler, companies, target_id, pages, page_hash):
     if platform_name == "JOBKOREA":
-        job_summaray = await crawler.fetch_job_summary(target_id)
+        job_summaray, detail_contents = await crawler.parse_job_pages(target_id, pages)
         if job_summaray is None:
             return
-        detail_contents = await crawler.fetch_job_detail(target_id)
-        company_id = job_summaray.get("company_id")
-        if job_summaray["company_info"] is not None and repository.need_company_crawling(company_id, expire_days=7) in ("new", "renew"):
-            if company_url := job_summaray["company_info"]["company_url"]:
-                company_info = await crawler.fetch_company_info(company_url)
-            else:
-                company_info = dict()
-            company_info = company_info | job_summaray.pop("company_info")
-        else:
-            del job_summaray["company_info"]
-            company_info = None
+        company_info = None
+        if (summary_company := job_summaray.pop("company_info")) is not None:
+            company_id = job_summaray.get("company_id")
+            if (company_info := await companies.resolve(company_id, lambda: fetch_company_page(crawler, summary_company))) is not None:
+                company_info = company_info | summary_company
 
         data = {
             "company": company_info,
@@ -123,20 +330,14 @@ async def process_single_job(platform_name, crawler, repository, target_id):
         }
 
     elif platform_name == "SARAMIN":
-        job_summaray = await crawler.fetch_job_summary(target_id)
+        job_summaray, detail_contents = await crawler.parse_job_pages(target_id, pages)
         if job_summaray is None:
             return
-        detail_contents = await crawler.fetch_job_detail(target_id)
-        csn = job_summaray.get("csn")
-        if job_summaray["company_info"] is not None and  repository.need_company_crawling(csn, expire_days=7) in ("new", "renew"):
-            if company_url := job_summaray["company_info"]["company_url"]:
-                company_info = await crawler.fetch_company_info(company_url)
-            else:
-                company_info = dict()
-            company_info = company_info | job_summaray.pop("company_info")
-        else:
-            del job_summaray["company_info"]
-            company_info = None
+        company_info = None
+        if (summary_company := job_summaray.pop("company_info")) is not None:
+            csn = job_summaray.get("csn")
+            if (company_info := await companies.resolve(csn, lambda: fetch_company_page(crawler, summary_company))) is not None:
+                company_info = company_info | summary_company
 
         data = {
             "company": company_info,
@@ -147,35 +348,42 @@ async def process_single_job(platform_name, crawler, repository, target_id):
         }
 
     elif platform_name == "WANTED":
-        job_detail_data = await crawler.fetch_job_detail(target_id)
-        company_id = job_detail_data.get("company_id")
-        if repository.need_company_crawling(company_id, expire_days=7) in ("new", "renew"):
-            if company_id := job_detail_data.get('company_id'):
-                company_info_data = await crawler.fetch_company_info(company_id)
-        else:
-            company_info_data = None
+        job_detail_data = await crawler.parse_job_pages(target_id, pages)
+        if job_detail_data is None:
+            return
+        company_info_data = None
+        if company_id := job_detail_data.get("company_id"):
+            company_info_data = await companies.resolve(company_id, lambda: crawler.fetch_company_info(company_id))
 
         data = {
-            "company": company_info_data if company_id else None,
+            "company": company_info_data,
             "job": job_detail_data,
         }
 
+    data["job"]["content_hash"] = page_hash
     return data
 
-async def main():
+async def main(resume=False):
     logger = setup_logger("Crawler")
     logger.info("============== [통합 크롤러 시작] ==============")
 
     nosql_repository = NoSQLRepository(logger)
     try:
         await asyncio.gather(
-            run_crawler_task("WANTED", WantedCrawler(logger=logger), logger, nosql_repository),
-            run_crawler_task("SARAMIN", SaraminCrawler(logger=logger), logger, nosql_repository),
-            run_crawler_task("JOBKOREA", JobkoreaCrawler(logger=logger), logger, nosql_repository)
+            run_crawler_task("WANTED", WantedCrawler(logger=logger), logger, nosql_repository, resume=resume),
+            run_crawler_task("SARAMIN", SaraminCrawler(logger=logger), logger, nosql_repository, resume=resume),
+            run_crawler_task("JOBKOREA", JobkoreaCrawler(logger=logger), logger, nosql_repository, resume=resume)
         )
     finally:
         nosql_repository.close()
+        ParsePool.shutdown()
+        for host, bucket in HostRateLimiter.stats().items():
+            logger.info(f"🪣 [{host}] 요청 속도 제한 {bucket['rate']}/s (burst {bucket['burst']}) | "
+                        f"요청: {bucket['acquired']}건 | 누적 대기: {bucket['waited']}s")
         logger.info("============== [모든 크롤러 종료] ==============")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="채용 공고 수집기")
+    parser.add_argument("--resume", action="store_true", help="지난 실행의 체크포인트(목록 커서, 미처리 공고)부터 이어서 수집")
+    args = parser.parse_args()
+    asyncio.run(main(resume=args.resume))
\ No newline at end of file
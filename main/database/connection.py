@@ -1,8 +1,14 @@
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from config.setting import Setting
+from database.models import Base
 
 def get_engine():
+    if Setting.DATABASE_URL:
+        engine = create_engine(Setting.DATABASE_URL)
+        Base.metadata.create_all(engine)
+        return engine
+
     connect_args = {}
 
     if Setting.WALLET_DIR:
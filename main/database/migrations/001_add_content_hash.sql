@@ -0,0 +1,7 @@
+-- 공고 본문 해시 컬럼 추가 (Oracle)
+-- 변경 없는 공고는 파싱/저장을 건너뛰기 위해 공고 응답 본문을 정규화한 SHA-256 hex를 저장한다.
+-- 기존 행은 NULL로 두며, 다음 수집 때 채워진다.
+
+ALTER TABLE RAW_SARAMIN_JOBS ADD (content_hash VARCHAR2(64));
+ALTER TABLE RAW_JOBKOREA_JOBS ADD (content_hash VARCHAR2(64));
+ALTER TABLE RAW_WANTED_JOBS ADD (content_hash VARCHAR2(64));
@@ -0,0 +1,10 @@
+-- 플랫폼별 수집 워터마크 테이블 생성 (Oracle)
+-- watermark: 지난 실행까지 빠짐없이 처리한 가장 큰 공고 id
+-- held_ids: 워터마크를 묶고 있는 공고 id별 연속 실패 횟수 (JSON)
+
+CREATE TABLE CRAWL_STATE (
+    platform    VARCHAR2(20) PRIMARY KEY,
+    watermark   NUMBER,
+    held_ids    CLOB,
+    updated_at  TIMESTAMP DEFAULT SYSTIMESTAMP
+);
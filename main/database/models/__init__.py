@@ -21,10 +21,12 @@ from .wanted import (
     RawWantedJobAttraction,
     RawWantedJobImage
 )
+from .crawl_state import CrawlState
 
 __all__ = [
     "Base",
     "RawSaraminCompany", "RawSaraminJob", "RawSaraminJobImage", "RawSaraminJobTag", "RawSaraminJobBenefit",
     "RawJobkoreaCompany", "RawJobkoreaJob", "RawJobkoreaJobImage", "RawJobkoreaJobTag", "RawJobkoreaJobBenefit",
     "RawWantedCompany", "RawWantedJob", "RawWantedJobDetail", "RawWantedJobSkill", "RawWantedJobAttraction", "RawWantedJobImage",
+    "CrawlState",
 ]
\ No newline at end of file
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, func
+from .base import Base
+
+
+class CrawlState(Base):
+    __tablename__ = 'CRAWL_STATE'
+
+    platform = Column(String(20), primary_key=True)
+    watermark = Column(Integer)
+    # 워터마크를 묶고 있는 공고 id별로 연속해서 놓친 실행 횟수 (JSON)
+    held_ids = Column(Text)
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
@@ -39,6 +39,7 @@ class RawJobkoreaJob(Base):
     address = Column(String(500))
     career = Column(String(100))
     education = Column(String(100))
+    content_hash = Column(String(64))
     crawled_at = Column(TIMESTAMP, server_default=func.now())
 
     company = relationship("RawJobkoreaCompany", back_populates="jobs")
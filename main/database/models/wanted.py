@@ -38,6 +38,7 @@ class RawWantedJob(Base):
     annual_to = Column(Integer)
     employment_type = Column(String(50))
     job_url = Column(String(1000))
+    content_hash = Column(String(64))
     crawled_at = Column(TIMESTAMP, server_default=func.now())
 
     company = relationship("RawWantedCompany", back_populates="jobs")
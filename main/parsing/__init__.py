@@ -0,0 +1,5 @@
+from .backend import BACKENDS, parse_html, set_default_backend
+from .classifier import IMAGE, TEXT, KeywordClassifier, get_classifier
+from .markdown import render_markdown
+from .sanitizer import sanitize_detail
+from .scope import SectionFilter, section_filter, set_scoped_parsing
@@ -0,0 +1,72 @@
+import importlib.util
+import logging
+from bs4 import BeautifulSoup, Comment
+from bs4.builder import HTMLParserTreeBuilder
+from config.setting import Setting
+
+logger = logging.getLogger("Crawler").getChild("Parser")
+
+BACKENDS = ("html.parser", "lxml", "lexbor")
+_REQUIRED_MODULE = {"html.parser": None, "lxml": "lxml", "lexbor": "selectolax"}
+
+
+class LexborTreeBuilder(HTMLParserTreeBuilder):
+    """selectolax(lexbor)로 파싱한 트리를 BeautifulSoup 트리로 옮기는 빌더.
+
+    파싱은 C 구현인 lexbor가 하고, 크롤러 쪽은 기존 BeautifulSoup API를 그대로 쓴다.
+    """
+
+    NAME = "lexbor"
+    features = [NAME]
+
+    def feed(self, markup):
+        from selectolax.lexbor import LexborHTMLParser
+
+        root = LexborHTMLParser(markup).root
+        if root is not None:
+            self._emit(root)
+
+    def _emit(self, node):
+        soup = self.soup
+        tag = node.tag
+        if tag == "-text":
+            soup.handle_data(node.text_content)
+        elif tag == "-comment":
+            soup.endData()
+            soup.handle_data(node.comment_content)
+            soup.endData(Comment)
+        elif not tag.startswith("-"):
+            attrs = {key: "" if value is None else value for key, value in node.attributes.items()}
+            soup.handle_starttag(tag, None, None, attrs)
+            for child in node.iter(include_text=True):
+                self._emit(child)
+            soup.handle_endtag(tag)
+
+
+def resolve_backend(name):
+    if name not in BACKENDS:
+        raise ValueError(f"지원하지 않는 HTML 파서입니다: {name} (가능: {', '.join(BACKENDS)})")
+    module = _REQUIRED_MODULE[name]
+    if module and importlib.util.find_spec(module) is None:
+        logger.warning(f"⚠️  {module} 패키지가 없어 html.parser로 대체합니다.")
+        return "html.parser"
+    return name
+
+
+DEFAULT_BACKEND = resolve_backend(Setting.HTML_PARSER_BACKEND)
+
+
+def set_default_backend(name):
+    global DEFAULT_BACKEND
+    DEFAULT_BACKEND = resolve_backend(name)
+
+
+def parse_html(markup, encoding=None, backend=None, parse_only=None):
+    backend = resolve_backend(backend) if backend else DEFAULT_BACKEND
+    # 문자열을 넘기면 이미 디코딩된 것이므로 인코딩 힌트는 bytes일 때만 넘긴다
+    kwargs = {"from_encoding": encoding} if isinstance(markup, bytes) and encoding else {}
+    if parse_only is not None:
+        kwargs["parse_only"] = parse_only
+    if backend == "lexbor":
+        return BeautifulSoup(markup, builder=LexborTreeBuilder(), **kwargs)
+    return BeautifulSoup(markup, backend, **kwargs)
@@ -0,0 +1,87 @@
+from functools import lru_cache
+import emoji
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+TEXT = "text"
+IMAGE = "image"
+MIN_TEXT_LENGTH = 200
+
+
+# 이모지의 첫 글자로 쓰이는 문자. 숫자/#/*로 시작하는 키캡(1️⃣)은 뒤의 ⃣로 찾는다
+EMOJI_FIRST_CHARS = frozenset(e[0] for e in emoji.EMOJI_DATA if not e[0].isascii()) | {"\u20e3"}
+EMOJI_MAX_LENGTH = max(len(e) for e in emoji.EMOJI_DATA)
+
+
+def has_emoji(text):
+    """첫 번째 이모지를 찾는 즉시 True를 돌려준다.
+
+    본문 문자 집합으로 후보 문자를 먼저 거르고, 후보 주변만 emoji 라이브러리로 확인한다.
+    """
+    for char in EMOJI_FIRST_CHARS.intersection(text):
+        start = text.find(char)
+        while start != -1:
+            if emoji.emoji_list(text[max(0, start - 2):start + EMOJI_MAX_LENGTH]):
+                return True
+            start = text.find(char, start + 1)
+    return False
+
+
+class KeywordClassifier:
+    """본문의 핵심 키워드 위치를 찾고 content_type을 정한다.
+
+    pyahocorasick이 설치돼 있으면 Aho–Corasick 오토마톤으로 모든 키워드를 한 번에 찾고,
+    없으면 키워드별 str.find로 같은 결과를 만든다.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = tuple(dict.fromkeys(keywords))
+        self.automaton = None
+        if ahocorasick is not None:
+            self.automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self.automaton.add_word(keyword, keyword)
+            self.automaton.make_automaton()
+
+    def find_keywords(self, text):
+        """(시작 위치, 키워드) 목록을 위치 순으로 돌려준다. 겹치는 매치도 모두 포함한다."""
+        if self.automaton is not None:
+            matches = [(end - len(keyword) + 1, keyword) for end, keyword in self.automaton.iter(text)]
+        else:
+            matches = []
+            for keyword in self.keywords:
+                start = text.find(keyword)
+                while start != -1:
+                    matches.append((start, keyword))
+                    start = text.find(keyword, start + 1)
+        matches.sort()
+        return matches
+
+    def classify(self, text, has_image):
+        """(content_type, 키워드 매치 목록)을 돌려준다.
+
+        짧은 본문에 이미지가 있거나, 키워드 없이 이미지만 있으면 이미지 공고로 본다.
+        단, 키워드가 없어도 이모지가 있으면 직접 작성한 텍스트 공고로 본다.
+        """
+        matches = self.find_keywords(text)
+
+        content_type = TEXT
+        if len(text) < MIN_TEXT_LENGTH and has_image:
+            content_type = IMAGE
+        if not matches and has_image:
+            content_type = TEXT if has_emoji(text) else IMAGE
+
+        return content_type, matches
+
+
+@lru_cache(maxsize=None)
+def _cached_classifier(keywords):
+    return KeywordClassifier(keywords)
+
+
+def get_classifier(keywords):
+    # 파싱 워커 프로세스마다 오토마톤을 한 번만 만든다
+    return _cached_classifier(tuple(keywords))
@@ -0,0 +1,64 @@
+import re
+import html2text
+from bs4 import NavigableString, Tag
+from bs4.element import PreformattedString
+
+RAW_TEXT_TAGS = frozenset(("script", "style"))
+ESCAPED_CHAR_PATTERN = re.compile(r'([&<>])')
+ENTITY_NAMES = {"&": "amp", "<": "lt", ">": "gt"}
+
+
+def new_converter():
+    h = html2text.HTML2Text()
+    h.ignore_links = False
+    h.ignore_images = True
+    h.body_width = 0
+    return h
+
+
+def attr_items(tag):
+    # str(soup) → HTMLParser를 거쳤을 때와 같은 형태: 여러 값 속성은 공백으로 합치고 값 없는 속성은 None
+    return [(name, " ".join(value) if isinstance(value, list) else value) for name, value in tag.attrs.items()]
+
+
+def render_markdown(soup, converter=None):
+    """파싱된 트리를 직접 순회해 html2text와 같은 마크다운을 만든다.
+
+    str(soup)로 직렬화한 문서를 html2text가 다시 파싱할 때 받는 이벤트
+    (시작 태그, 텍스트, &amp;/&lt;/&gt; 엔티티, 끝 태그)를 같은 순서로 변환기에 바로 넘긴다.
+    """
+    h = converter or new_converter()
+    h.start = True
+
+    # 끝 태그는 (이름,) 튜플로 스택에 넣는다
+    stack = list(reversed(soup.contents))
+    while stack:
+        node = stack.pop()
+        if type(node) is tuple:
+            h.handle_endtag(node[0])
+        elif isinstance(node, Tag):
+            h.handle_starttag(node.name, attr_items(node))
+            stack.append((node.name,))
+            stack.extend(reversed(node.contents))
+        elif isinstance(node, PreformattedString):
+            # 주석, CDATA, doctype 등은 html2text가 무시한다
+            continue
+        else:
+            # 요소를 지우고 남은 인접 텍스트는 직렬화하면 한 덩어리가 되므로 합쳐서 넘긴다
+            text = str(node)
+            while stack and isinstance(stack[-1], NavigableString) and not isinstance(stack[-1], PreformattedString):
+                text += stack.pop()
+            if node.parent is not None and node.parent.name in RAW_TEXT_TAGS:
+                if text:
+                    h.handle_data(text)
+                continue
+            for i, piece in enumerate(ESCAPED_CHAR_PATTERN.split(text)):
+                if i % 2:
+                    h.handle_entityref(ENTITY_NAMES[piece])
+                elif piece:
+                    h.handle_data(piece)
+
+    markdown = h.optwrap(h.finish())
+    if h.pad_tables:
+        return html2text.pad_tables_in_text(markdown)
+    return markdown
@@ -0,0 +1,60 @@
+import re
+from bs4 import CData, NavigableString, Tag
+
+REMOVE_TAGS = frozenset(("script", "style", "noscript"))
+HIDDEN_STYLE_PATTERN = re.compile(r'(font-size:\s*0|height:\s*0|width:\s*0|display:\s*none|visibility:\s*hidden)', re.IGNORECASE)
+HIDDEN_CLASS_PATTERN = re.compile(r'(blind|hidden|sr-only)')
+TEXT_TYPES = (NavigableString, CData)
+
+
+def is_hidden(tag):
+    if tag.name == "p" and tag.get("hidden") is not None:
+        return True
+    if (style := tag.get("style")) and HIDDEN_STYLE_PATTERN.search(style):
+        return True
+    if classes := tag.get("class"):
+        if isinstance(classes, str):
+            classes = [classes]
+        return any(HIDDEN_CLASS_PATTERN.search(name) for name in classes)
+    return False
+
+
+def normalize_image_url(src):
+    return f"https:{src}" if src.startswith("//") else src
+
+
+def sanitize_detail(soup):
+    """상세 본문 트리를 한 번만 순회하며 정리한다.
+
+    script/style/noscript 제거, 이미지 수집, 숨김 요소(hidden 속성, 숨김 style, blind 계열 class) 제거,
+    텍스트 추출을 한 번에 처리하고 (정리된 트리, 텍스트, 이미지 목록)을 돌려준다.
+    이미지는 기존과 같이 숨김 요소 안에 있어도 수집한다.
+    """
+    images = []
+    texts = []
+    removed = []
+    hidden = []
+
+    stack = [(soup, False)]
+    while stack:
+        node, in_hidden = stack.pop()
+        if isinstance(node, Tag):
+            if node.name in REMOVE_TAGS:
+                removed.append(node)
+                continue
+            if node.name == "img" and (src := node.get("src")):
+                images.append(normalize_image_url(src))
+            if not in_hidden and is_hidden(node):
+                hidden.append(node)
+                in_hidden = True
+            stack.extend((child, in_hidden) for child in reversed(node.contents))
+        elif not in_hidden and type(node) in TEXT_TYPES:
+            if text := node.strip():
+                texts.append(text)
+
+    for node in removed:
+        node.extract()
+    for node in hidden:
+        node.decompose()
+
+    return soup, " ".join(texts), images
@@ -0,0 +1,111 @@
+import soupsieve as sv
+
+
+def text(element):
+    return element.text.strip()
+
+
+def first_string(element):
+    return element.contents[0].strip()
+
+
+def joined_strings(element):
+    return element.get_text(separator=" ", strip=True)
+
+
+def attr(name):
+    return lambda element: element.get(name)
+
+
+def compile_selector(selector):
+    return sv.compile(selector) if selector else None
+
+
+class Field:
+    """selector로 찾은 요소에서 값을 뽑는 규칙. selector가 없으면 넘겨받은 요소 자체에서 뽑는다.
+
+    요소가 없으면 default를, 있으면 extract 결과에 post를 적용한 값을 돌려준다.
+    """
+
+    def __init__(self, selector=None, extract=text, post=None, default=None):
+        self.selector = compile_selector(selector)
+        self.extract = extract
+        self.post = post
+        self.default = default
+
+    def __call__(self, root):
+        return self.value_of(self.selector.select_one(root) if self.selector else root)
+
+    def value_of(self, element):
+        if element is None:
+            return self.default
+        value = self.extract(element)
+        return self.post(value) if self.post else value
+
+
+class LabeledFields:
+    """"라벨: 값" 항목이 반복되는 목록을 라벨 → 필드 표로 읽는 규칙.
+
+    fields는 {라벨: (필드 이름, 값 요소에 적용할 Field)} 형태이며, 표에 없는 라벨은 건너뛴다.
+    같은 라벨이 여러 번 나오면 마지막 값이 남는다.
+    """
+
+    def __init__(self, items, label, value, fields, label_extract=text):
+        self.items = compile_selector(items)
+        self.label = compile_selector(label)
+        self.value = compile_selector(value)
+        self.fields = fields
+        self.label_extract = label_extract
+
+    def __call__(self, root):
+        return self.read(self.items.select(root))
+
+    def read(self, items):
+        result = {}
+        for item in items:
+            label = self.label.select_one(item)
+            if label is None or (field := self.fields.get(self.label_extract(label))) is None:
+                continue
+            value = self.value.select_one(item) if self.value else item
+            if value is not None:
+                name, rule = field
+                result[name] = rule(value)
+        return result
+
+
+class Schema:
+    """필드 이름 → 규칙(Field/LabeledFields) 목록. 모듈을 불러올 때 셀렉터를 한 번만 컴파일해 두고 문서마다 재사용한다.
+
+    extract는 필드마다 트리를 따로 훑지 않고, 모든 최상위 셀렉터를 묶은 셀렉터로 문서를 한 번만 훑는다.
+    Field는 문서 순서상 처음 맞는 요소(select_one)를, LabeledFields는 맞는 항목 전부(select)를 쓴다.
+    LabeledFields의 결과는 이름 없이 결과 dict에 펼친다.
+    """
+
+    def __init__(self, rules):
+        self.rules = list(rules.items())
+        self.fields = [(index, rule.selector) for index, (_, rule) in enumerate(self.rules)
+                       if isinstance(rule, Field) and rule.selector]
+        self.item_lists = [(index, rule.items) for index, (_, rule) in enumerate(self.rules)
+                           if isinstance(rule, LabeledFields)]
+        # 모든 최상위 셀렉터를 하나의 셀렉터 목록으로 묶어, 트리 순회는 한 번만 하고 맞은 요소만 규칙별로 나눈다
+        selectors = [selector.pattern for _, selector in self.fields + self.item_lists]
+        self.combined = compile_selector(", ".join(selectors)) if selectors else None
+
+    def extract(self, root):
+        found = {}
+        items = {index: [] for index, _ in self.item_lists}
+        for element in self.combined.select(root) if self.combined else ():
+            for index, selector in self.fields:
+                if index not in found and selector.match(element):
+                    found[index] = element
+            for index, selector in self.item_lists:
+                if selector.match(element):
+                    items[index].append(element)
+
+        result = {}
+        for index, (name, rule) in enumerate(self.rules):
+            if isinstance(rule, LabeledFields):
+                result.update(rule.read(items[index]))
+            else:
+                result[name] = rule.value_of(found.get(index) if rule.selector else root)
+        return result
@@ -0,0 +1,57 @@
+from bs4.filter import ElementFilter
+
+SCOPED_PARSING = True
+
+
+def set_scoped_parsing(enabled):
+    global SCOPED_PARSING
+    SCOPED_PARSING = enabled
+
+
+class SectionFilter(ElementFilter):
+    """필요한 섹션만 트리로 만드는 parse_only 필터.
+
+    rules는 (태그 이름, 속성 조건) 목록이다. 이름이 None이면 모든 태그에 적용하고,
+    class 조건은 적힌 클래스를 모두 포함하는지, 나머지 속성은 값이 같은지 본다.
+    heading_tags의 태그는 바로 다음 형제 요소까지 남겨서 "h2 + 본문 블록" 구조의 find_next_sibling()이 그대로 동작한다.
+    """
+
+    def __init__(self, rules, heading_tags=()):
+        super().__init__()
+        self.rules = [(name, {key: value.split() if key == "class" else value for key, value in attrs.items()})
+                      for name, attrs in rules]
+        self.heading_tags = frozenset(heading_tags)
+        self.keep_next = False
+
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        # 남긴 요소의 자손은 묻지 않으므로, 제목 다음에 호출되는 태그가 곧 제목의 다음 형제다
+        if self.keep_next or name in self.heading_tags:
+            self.keep_next = name in self.heading_tags
+            return True
+        attrs = attrs or {}
+        return any(self.matches(rule, name, attrs) for rule in self.rules)
+
+    def allow_string_creation(self, string):
+        return False
+
+    @staticmethod
+    def matches(rule, name, attrs):
+        rule_name, rule_attrs = rule
+        if rule_name is not None and rule_name != name:
+            return False
+        for key, expected in rule_attrs.items():
+            value = attrs.get(key)
+            if value is None:
+                return False
+            if key == "class":
+                classes = value.split() if isinstance(value, str) else value
+                if not all(c in classes for c in expected):
+                    return False
+            elif value != expected:
+                return False
+        return True
+
+
+def section_filter(rules, heading_tags=()):
+    # 필터는 파싱 중 상태를 가지므로 문서마다 새로 만든다
+    return SectionFilter(rules, heading_tags) if SCOPED_PARSING else None
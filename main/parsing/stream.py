@@ -0,0 +1,65 @@
+import codecs
+from html.parser import HTMLParser
+
+VOID_ELEMENTS = frozenset(("area", "base", "br", "col", "embed", "hr", "img", "input",
+                           "link", "meta", "param", "source", "track", "wbr"))
+
+
+class StreamingExtractor(HTMLParser):
+    """필요한 값을 다 찾으면 나머지 문서는 파싱하지 않는 증분 파서.
+
+    하위 클래스는 start/end/data에서 self.stack(열려 있는 (태그, 속성) 목록)을 보고 값을 모으고,
+    다 모았으면 self.done = True로 바꾼다. start는 요소를 스택에 넣기 전에, end는 꺼낸 뒤에 호출된다.
+    """
+
+    chunk_size = 16 * 1024
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stack = []
+        self.done = False
+
+    def start(self, tag, attrs):
+        pass
+
+    def end(self, tag):
+        pass
+
+    def data(self, text):
+        pass
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        attrs = dict(attrs)
+        self.start(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.stack.append((tag, attrs))
+
+    def handle_endtag(self, tag):
+        if self.done:
+            return
+        # 닫히지 않은 자식 태그가 있으면 같이 닫는다
+        for index in range(len(self.stack) - 1, -1, -1):
+            if self.stack[index][0] == tag:
+                del self.stack[index:]
+                self.end(tag)
+                return
+
+    def handle_data(self, data):
+        if not self.done:
+            self.data(data)
+
+    def parse(self, content, encoding=None):
+        decoder = codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+        for offset in range(0, len(content), self.chunk_size):
+            self.feed(decoder.decode(content[offset:offset + self.chunk_size]))
+            if self.done:
+                return self
+        self.feed(decoder.decode(b"", final=True))
+        self.close()
+        return self
+
+
+def has_class(attrs, name):
+    return name in (attrs.get("class") or "").split()
@@ -2,6 +2,7 @@ from .base import BaseRepository
 from .wanted import WantedRepository
 from .saramin import SaraminRepository
 from .jobkorea import JobkoreaRepository
+from .crawl_state import CrawlStateRepository
 
 class RepositoryFactory:
     @staticmethod
@@ -1,4 +1,4 @@
-from sqlalchemy import select
+from sqlalchemy import select, update, func
 from datetime import datetime, timedelta
 
 class BaseRepository:
@@ -35,4 +35,36 @@ class BaseRepository:
         if stored_time < limit_date:
             return "renew"
 
-        return "pass"
\ No newline at end of file
+        return "pass"
+
+    def need_crawling_many(self, id_list, expire_days, model_cls, pk_column):
+        # need_crawling과 같은 판정을 IN 쿼리 한 번으로 한다
+        if not id_list:
+            return dict()
+        stmt = select(pk_column, model_cls.crawled_at).where(pk_column.in_(id_list))
+        stored_times = {str(id_value): stored_time for id_value, stored_time in self.session.execute(stmt).all()}
+
+        limit_date = datetime.now() - timedelta(days=expire_days)
+        flags = dict()
+        for id_value in id_list:
+            stored_time = stored_times.get(str(id_value))
+            if stored_time is None:
+                flags[id_value] = "new"
+            elif stored_time < limit_date:
+                flags[id_value] = "renew"
+            else:
+                flags[id_value] = "pass"
+        return flags
+
+    def get_content_hashes(self, id_list):
+        if not id_list:
+            return dict()
+        stmt = select(self.pk_column, self.model.content_hash).where(self.pk_column.in_(id_list))
+        return {str(id_value): content_hash for id_value, content_hash in self.session.execute(stmt).all()}
+
+    def touch_jobs(self, id_list):
+        # 본문이 그대로인 공고는 다시 저장하지 않고 수집 시각만 갱신한다
+        if not id_list:
+            return 0
+        stmt = update(self.model).where(self.pk_column.in_(id_list)).values(crawled_at=func.now())
+        return self.session.execute(stmt).rowcount
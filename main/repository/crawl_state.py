@@ -0,0 +1,19 @@
+from .base import BaseRepository
+from database.models.crawl_state import CrawlState
+from utils import json_codec
+
+class CrawlStateRepository(BaseRepository):
+    def __init__(self, session, logger):
+        super().__init__(session, CrawlState, CrawlState.platform, logger)
+
+    def get_watermark(self, platform):
+        state = self.get_by_id(platform)
+        return state.watermark if state is not None else None
+
+    def get_held_ids(self, platform):
+        state = self.get_by_id(platform)
+        return json_codec.loads(state.held_ids) if state is not None and state.held_ids else {}
+
+    def save_watermark(self, platform, watermark, held_ids=None):
+        self.session.merge(CrawlState(platform=platform, watermark=watermark, held_ids=json_codec.dumps(held_ids or {})))
+        self.session.flush()
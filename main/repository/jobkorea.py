@@ -14,6 +14,9 @@ class JobkoreaRepository(BaseRepository):
     def need_company_crawling(self, id_value, expire_days=30):
         return self.need_crawling(id_value, expire_days, RawJobkoreaCompany, RawJobkoreaCompany.company_id)
 
+    def need_companies_crawling(self, id_list, expire_days=30):
+        return self.need_crawling_many(id_list, expire_days, RawJobkoreaCompany, RawJobkoreaCompany.company_id)
+
     def save_job(self, data):
         if company_data := data["company"]:
             company = RawJobkoreaCompany(**company_data)
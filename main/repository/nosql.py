@@ -1,4 +1,4 @@
-import json
+from utils import json_codec
 import logging
 from borneo import (
     NoSQLHandle,
@@ -10,6 +10,7 @@ from borneo import (
 )
 from borneo.iam import SignatureProvider
 from config.setting import Setting
+import threading
 import traceback
 
 class NoSQLRepository:
@@ -21,6 +22,9 @@ class NoSQLRepository:
 
         self.handle = self.create_handle()
         self.check_stmt = None
+        # 플랫폼별 파이프라인이 각자 스레드에서 저장하므로, 공유하는 prepared statement의 $url과
+        # 중복 확인 후 저장 사이를 한 번에 하나씩만 쓰게 묶는다
+        self.write_lock = threading.Lock()
         if self.handle:
             self.prepare_check_query()
 
@@ -87,18 +91,18 @@ class NoSQLRepository:
                 self.logger.warning(f"[{platform}] ⚠️  URL이 없어 저장을 건너뜁니다.")
                 return False
 
-            if self.exists_by_url(unique_url):
-                self.logger.debug(f"⏭️ 이미 존재하는 공고 (Skip): {unique_url}")
-                return False
-            
             row_to_put = {
                 'source_url': unique_url,
                 'platform': platform,
-                'raw_json_content': json.dumps(job_data, ensure_ascii=False)
+                'raw_json_content': json_codec.dumps(job_data)
             }
-
             req = PutRequest().set_table_name(self.table_name).set_value(row_to_put)
-            self.handle.put(req)
+
+            with self.write_lock:
+                if self.exists_by_url(unique_url):
+                    self.logger.debug(f"⏭️ 이미 존재하는 공고 (Skip): {unique_url}")
+                    return False
+                self.handle.put(req)
             self.logger.debug(f"💾 저장 성공: {unique_url}")
             return True
 
@@ -0,0 +1,79 @@
+import os
+import time
+from utils import json_codec
+
+
+class CrawlCheckpoint:
+    """플랫폼별 목록 커서와 아직 커밋되지 않은/실패한 공고 id를 로컬 파일에 남긴다.
+
+    커서 앞쪽 공고는 모두 커밋됐거나 pending/failed에 들어 있으므로,
+    --resume으로 이어 갈 때 커서부터 목록을 다시 읽고 두 집합만 다시 처리하면 된다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.cursor = None
+        self.newest_id = None
+        self.saved_at = None
+        # 플랫폼마다 id 타입(int/str)이 달라서 str(id) -> 원래 id로 들고 있는다
+        self.pending = {}
+        self.failed = {}
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    def load(self, max_age=None):
+        """체크포인트를 읽는다. max_age초보다 오래됐으면 다른 실행이 남긴 것으로 보고 읽지 않는다."""
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, "rb") as f:
+            data = json_codec.loads(f.read())
+        # 끝까지 수집한 실행이 남긴 표시. 그보다 먼저 죽은 실행의 체크포인트가 되살아나지 않게 한다
+        if data.get("cleared"):
+            return False
+        self.saved_at = data.get("saved_at")
+        if max_age is not None and (self.saved_at is None or time.time() - self.saved_at > max_age):
+            return False
+        self.cursor = data["cursor"]
+        self.newest_id = data.get("newest_id")
+        self.pending = {str(job_id): job_id for job_id in data.get("pending", [])}
+        self.failed = {str(job_id): job_id for job_id in data.get("failed", [])}
+        return True
+
+    def add(self, job_ids):
+        self.pending.update((str(job_id), job_id) for job_id in job_ids)
+
+    def done(self, job_id):
+        self.pending.pop(str(job_id), None)
+        self.failed.pop(str(job_id), None)
+
+    def fail(self, job_id):
+        self.pending.pop(str(job_id), None)
+        self.failed[str(job_id)] = job_id
+
+    def unfinished(self):
+        return list({**self.pending, **self.failed}.values())
+
+    def retry_ids(self):
+        # 지난 실행에서 처리 중이던 공고와 실패한 공고를 다시 처리 대상으로 돌린다
+        job_ids = self.unfinished()
+        self.pending, self.failed = {str(job_id): job_id for job_id in job_ids}, {}
+        return job_ids
+
+    def save(self):
+        self._write({
+            "cursor": self.cursor,
+            "newest_id": self.newest_id,
+            "pending": list(self.pending.values()),
+            "failed": list(self.failed.values()),
+            "saved_at": time.time(),
+        })
+
+    def clear(self):
+        # 파일을 지우지 않고 완료 표시로 덮어써서, 외부에 캐시된 예전 체크포인트도 함께 무효로 만든다
+        self._write({"cleared": True, "saved_at": time.time()})
+
+    def _write(self, data):
+        # 쓰는 도중에 죽어도 이전 체크포인트가 남도록 임시 파일에 쓴 뒤 바꿔치기한다
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(json_codec.dumps(data))
+        os.replace(temp_path, self.path)
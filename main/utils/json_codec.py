@@ -0,0 +1,34 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKEND = "orjson" if orjson else "json"
+
+
+def loads(data):
+    """bytes/str JSON을 파싱한다. orjson이 있으면 orjson을, 없거나 실패하면 표준 json을 쓴다."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # UTF-8이 아닌 본문 등은 표준 json의 인코딩 감지에 맡기고, 정말 잘못된 JSON이면 그쪽 예외를 그대로 올린다
+            pass
+    return json.loads(data)
+
+
+def dumps(obj):
+    """한글을 이스케이프하지 않은 compact JSON 문자열을 돌려준다. 어느 백엔드든 결과 형식은 같다."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def response_json(response):
+    # httpx Response.json()과 같이 디코딩 전 본문(bytes)을 그대로 파싱한다
+    return loads(response.content)
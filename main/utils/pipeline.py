@@ -0,0 +1,110 @@
+import asyncio
+import time
+
+STOP = object()
+
+
+class Stage:
+    def __init__(self, name, handler, workers=1, queue_size=None, batch_size=1, linger=0.0):
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+        self.batch_size = batch_size
+        self.linger = linger
+        # 큐가 가득 차면 앞 단계의 emit이 기다리므로 단계별로 백프레셔가 걸린다
+        self.queue = asyncio.Queue(maxsize=queue_size if queue_size is not None else workers * 2)
+
+        self.processed = 0
+        self.busy = 0.0
+
+    async def take(self):
+        item = await self.queue.get()
+        if item is STOP or self.batch_size == 1:
+            return item
+        # 배치 단계는 첫 항목을 받은 뒤 linger초까지 더 모아서 한 번에 처리한다
+        batch = [item]
+        deadline = time.monotonic() + self.linger
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                try:
+                    async with asyncio.timeout(remaining):
+                        item = await self.queue.get()
+                except TimeoutError:
+                    break
+            elif not self.queue.empty():
+                item = self.queue.get_nowait()
+            else:
+                break
+            if item is STOP:
+                await self.queue.put(STOP)
+                break
+            batch.append(item)
+        return batch
+
+
+class Pipeline:
+    """단계 사이를 크기가 정해진 asyncio 큐로 잇는 생산자/소비자 파이프라인.
+
+    각 단계의 handler(item, emit)는 workers 수만큼 동시에 돌고, emit으로 다음 단계에 넘긴다.
+    batch_size가 1보다 크면 item 대신 리스트를 받는다.
+    """
+
+    def __init__(self, stages):
+        self.stages = stages
+        self.stopped = asyncio.Event()
+
+    def stop(self):
+        # 처음 단계가 새 항목을 그만 만들게 하고, 이미 흘러간 항목은 끝까지 처리한다
+        self.stopped.set()
+
+    async def run(self, *seeds):
+        tasks = []
+        for index, stage in enumerate(self.stages):
+            downstream = self.stages[index + 1] if index + 1 < len(self.stages) else None
+            workers = [asyncio.create_task(self._work(stage, downstream)) for _ in range(stage.workers)]
+            tasks.append(asyncio.create_task(self._close_after(workers, downstream)))
+
+        tasks.append(asyncio.create_task(self._feed(seeds)))
+
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _feed(self, seeds):
+        first = self.stages[0]
+        for seed in seeds:
+            await first.queue.put(seed)
+        for _ in range(first.workers):
+            await first.queue.put(STOP)
+
+    async def _work(self, stage, downstream):
+        async def emit(item):
+            if downstream is not None:
+                await downstream.queue.put(item)
+
+        while (item := await stage.take()) is not STOP:
+            started = time.monotonic()
+            await stage.handler(item, emit)
+            stage.busy += time.monotonic() - started
+            stage.processed += len(item) if stage.batch_size > 1 else 1
+
+    async def _close_after(self, workers, downstream):
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+        if downstream is not None:
+            for _ in range(downstream.workers):
+                await downstream.queue.put(STOP)
+
+    def stats(self):
+        return {stage.name: {"processed": stage.processed, "workers": stage.workers, "busy": round(stage.busy, 1)}
+                for stage in self.stages}
@@ -0,0 +1,30 @@
+import os
+import sys
+import pytest
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+# 크롤러 코드는 main/ 기준으로 import하고, 비교용 기존 구현은 demo/benchmark의 것을 그대로 쓴다
+for path in (os.path.join(ROOT_DIR, "main"), os.path.join(ROOT_DIR, "demo", "benchmark")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), "rb") as f:
+        return f.read()
+
+
+@pytest.fixture
+def use_backend(monkeypatch):
+    """parse_html의 기본 백엔드를 테스트 동안만 바꾼다. 패키지가 없는 백엔드는 건너뛴다."""
+    from parsing import backend
+
+    def use(name):
+        module = backend._REQUIRED_MODULE[name]
+        if module:
+            pytest.importorskip(module)
+        monkeypatch.setattr(backend, "DEFAULT_BACKEND", name)
+
+    return use
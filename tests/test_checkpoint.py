@@ -0,0 +1,16 @@
+from utils.checkpoint import CrawlCheckpoint
+
+
+def test_cleared_checkpoint_is_not_resumed(tmp_path):
+    path = str(tmp_path / "wanted.json")
+    checkpoint = CrawlCheckpoint(path)
+    checkpoint.cursor = 40
+    checkpoint.add([3, 2, 1])
+    checkpoint.save()
+    assert CrawlCheckpoint(path).load(max_age=3600)
+
+    checkpoint.clear()
+    loaded = CrawlCheckpoint(path)
+    assert not loaded.load(max_age=3600)
+    # 완료 표시는 오래된 체크포인트 경고 대상도 아니다
+    assert loaded.saved_at is None and loaded.unfinished() == []
@@ -0,0 +1,45 @@
+import emoji
+import pytest
+from parsing import classifier
+from parsing.classifier import IMAGE, TEXT, KeywordClassifier, has_emoji
+
+KEYWORDS = ['주요업무', '담당업무', '자격요건', '우대사항', '지원자격', '모집부문', '근무조건', '전형절차',
+            '자격', '우대', '모집', '업무', '지원', '전형', '마감', '근무']
+
+TEXTS = [
+    "",
+    "주요업무: 백엔드 개발 / 자격요건: 3년 이상 / 우대사항: 클라우드 경험",
+    "지원자격 지원자격 지원 마감일 근무조건",
+    "키워드가 하나도 없는 본문입니다.",
+    "업무업무업무 겹치는 매치",
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_automaton_matches_str_find(monkeypatch, text):
+    pytest.importorskip("ahocorasick")
+    fast = KeywordClassifier(KEYWORDS)
+    monkeypatch.setattr(classifier, "ahocorasick", None)
+    fallback = KeywordClassifier(KEYWORDS)
+    assert fast.automaton is not None and fallback.automaton is None
+    assert fast.find_keywords(text) == fallback.find_keywords(text)
+    # 기존 판정(any(keyword in text))과 매치 유무가 같아야 한다
+    assert bool(fast.find_keywords(text)) == any(keyword in text for keyword in KEYWORDS)
+
+
+@pytest.mark.parametrize("text", [
+    "", "이모지 없음", "✨ 반짝", "끝에 🙂", "키캡 1️⃣ 번", "국기 🇰🇷", "피부색 👍🏽", "가족 👨‍👩‍👧",
+    "© 2026 저작권", "♥ 하트", "#해시 *별표 123", "한글" * 500 + "🚀",
+])
+def test_has_emoji_matches_emoji_list(text):
+    assert has_emoji(text) == (len(emoji.emoji_list(text)) > 0)
+
+
+def test_classify():
+    keyword_classifier = KeywordClassifier(KEYWORDS)
+    long_text = "회사 소개 " * 50
+    assert keyword_classifier.classify("짧은 본문", has_image=True)[0] == IMAGE
+    assert keyword_classifier.classify("짧은 본문", has_image=False)[0] == TEXT
+    assert keyword_classifier.classify(long_text, has_image=True)[0] == IMAGE
+    assert keyword_classifier.classify(long_text + "🙂", has_image=True)[0] == TEXT
+    assert keyword_classifier.classify(long_text + "주요업무", has_image=True)[0] == TEXT
@@ -0,0 +1,45 @@
+import pytest
+from conftest import read_fixture
+from crawler.jobkorea_crawler import GIReadParser, JobkoreaCrawler
+from parsing import parse_html
+
+
+def legacy_parse_basic_info(content, encoding):
+    """GIReadParser 도입 전의 BeautifulSoup 방식"""
+    soup = parse_html(content, encoding, backend="html.parser")
+    if has_info := soup.select_one('div.recruit-article-content'):
+        position = has_info.select_one('h1.recruit-title').text.strip()
+    is_active = not soup.select('div.navbarFooter > button')[-1].get('disabled')
+    return {
+        "position": position,
+        "is_active": bool(is_active),
+    }
+
+
+def gi_read(title="공고 제목", footer='<button>스크랩</button><button class="apply">지원하기</button>'):
+    return (f'<html><body><div class="recruit-article-content"><h1 class="recruit-title"> {title} </h1></div>'
+            f'<div class="navbarFooter">{footer}</div></body></html>').encode("utf-8")
+
+
+@pytest.mark.parametrize("content", [
+    read_fixture("jobkorea_gi_read.html"),
+    gi_read(),
+    gi_read(footer='<button>스크랩</button><button disabled="disabled">지원마감</button>'),
+    gi_read(title="<b>굵은</b> 제목 &amp; 기호"),
+])
+def test_gi_read_parser_matches_legacy(content):
+    assert JobkoreaCrawler.parse_basic_info(content, "utf-8") == legacy_parse_basic_info(content, "utf-8")
+
+
+def test_gi_read_parser_handles_chunk_boundaries(monkeypatch):
+    # 멀티바이트 문자와 태그가 청크 경계에 걸려도 결과가 같아야 한다
+    content = read_fixture("jobkorea_gi_read.html")
+    expected = legacy_parse_basic_info(content, "utf-8")
+    for chunk_size in (1, 7, 64):
+        monkeypatch.setattr(GIReadParser, "chunk_size", chunk_size)
+        assert JobkoreaCrawler.parse_basic_info(content, "utf-8") == expected
+
+
+def test_gi_read_parser_stops_after_footer():
+    parser = GIReadParser().parse(read_fixture("jobkorea_gi_read.html") + b"<div>" * 10000, "utf-8")
+    assert parser.done
@@ -0,0 +1,39 @@
+import asyncio
+import logging
+import types
+from crawler.base_crawler import BaseCrawler
+from crawler.hedging import HedgePolicy
+
+
+def run_hedged(latencies, queue_wait, backlogged):
+    """queue_wait만큼 로컬 리미터에서 기다린 뒤 latencies 순서대로 응답하는 가짜 전송으로 _send_hedged를 돌린다."""
+    hedging = HedgePolicy(min_samples=5, max_ratio=1.0)
+    latencies = iter(latencies)
+
+    async def send(method, url, on_sent=None, **kwargs):
+        await asyncio.sleep(queue_wait)
+        if on_sent:
+            on_sent()
+        await asyncio.sleep(next(latencies, 0.01))
+        return "ok"
+
+    crawler = types.SimpleNamespace(hedging=hedging, logger=logging.getLogger("Test"), platform="Test", _send=send,
+                                    limits_backlogged=lambda url: backlogged)
+
+    async def main():
+        for _ in range(10):
+            await BaseCrawler._send_hedged(crawler, "detail", "GET", "https://example.com")
+
+    asyncio.run(main())
+    return hedging
+
+
+def test_queue_wait_is_not_counted_as_latency():
+    hedging = run_hedged([0.01] * 10, queue_wait=0.05, backlogged=False)
+    assert max(hedging.latencies["detail"]) < 0.04
+
+
+def test_no_hedge_while_limiter_is_backlogged():
+    latencies = [0.01] * 6 + [0.2] * 4
+    assert run_hedged(latencies, queue_wait=0.0, backlogged=True).hedged == 0
+    assert run_hedged(latencies, queue_wait=0.0, backlogged=False).hedged > 0
@@ -0,0 +1,73 @@
+import asyncio
+import logging
+import time
+import httpx
+from crawler.base_crawler import BaseCrawler
+from crawler.http_cache import HttpCache
+from crawler.http_client import build_client
+
+
+def make_response(body=b"body"):
+    return httpx.Response(200, content=body, headers={"ETag": '"v1"'}, request=httpx.Request("GET", "https://example.com/a"))
+
+
+def test_expired_entry_is_a_miss(tmp_path):
+    cache = HttpCache(str(tmp_path / "cache.sqlite3"), logging.getLogger("Test"), ttl_days=1, parser_version=1)
+    cache.store("key", make_response())
+    cache.store_parsed("key", {"name": "값"})
+    assert cache.get("key")["parsed"] == {"name": "값"}
+
+    cache.conn.execute("UPDATE http_cache SET stored_at = ?", (time.time() - 2 * 24 * 60 * 60,))
+    assert cache.get("key") is None
+    cache.close()
+
+
+def test_revalidation_keeps_stored_at(tmp_path):
+    cache = HttpCache(str(tmp_path / "cache.sqlite3"), logging.getLogger("Test"), parser_version=1)
+    cache.store("key", make_response())
+    cache.conn.execute("UPDATE http_cache SET stored_at = 100")
+    cache.touch("key")
+    stored_at, validated_at = cache.conn.execute("SELECT stored_at, validated_at FROM http_cache").fetchone()
+    assert stored_at == 100 and validated_at > 100
+    cache.close()
+
+
+def test_parsed_result_from_other_parser_version_is_ignored(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = HttpCache(path, logging.getLogger("Test"), parser_version=1)
+    cache.store("key", make_response())
+    cache.store_parsed("key", {"name": "값"})
+    cache.close()
+
+    cache = HttpCache(path, logging.getLogger("Test"), parser_version=2)
+    entry = cache.get("key")
+    assert entry["body"] == b"body" and entry["parsed"] is None
+    cache.close()
+
+
+class FakeCrawler(BaseCrawler):
+    fetch_job_list = fetch_job_detail = fetch_company_info = fetch_job_pages = parse_job_pages = None
+
+
+def test_raw_response_is_revalidated_with_conditional_get(tmp_path):
+    def handler(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=b"body", headers={"ETag": '"v1"'})
+
+    crawler = FakeCrawler("https://example.com", "Test", logging.getLogger("Test"))
+    crawler.replay = True
+    crawler.client = build_client(crawler.header, httpx.MockTransport(handler))
+    crawler.cache = HttpCache(str(tmp_path / "cache.sqlite3"), logging.getLogger("Test"), parser_version=1)
+
+    async def main():
+        first = await crawler.fetch_cached_response("https://example.com/a")
+        second = await crawler.fetch_cached_response("https://example.com/a")
+        await crawler.client.aclose()
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert first.content == second.content == b"body"
+    assert second.status_code == 200
+    assert crawler.cache.stats()["hits"] == 1
+    crawler.cache.close()
@@ -0,0 +1,32 @@
+import json
+import pytest
+from conftest import read_fixture
+from utils import json_codec
+
+
+@pytest.fixture(params=["orjson", "json"])
+def codec(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_codec, "orjson", None)
+    return json_codec
+
+
+def test_loads_matches_json(codec):
+    content = read_fixture("wanted_detail.json")
+    assert codec.loads(content) == json.loads(content)
+    assert codec.loads(content.decode("utf-8")) == json.loads(content)
+
+
+def test_dumps_matches_compact_json(codec):
+    payload = json.loads(read_fixture("wanted_detail.json"))
+    assert codec.dumps(payload) == json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    assert codec.loads(codec.dumps(payload)) == payload
+
+
+def test_loads_non_utf8_falls_back_to_json(codec):
+    content = json.dumps({"position": "개발자"}).encode("utf-16")
+    assert codec.loads(content) == {"position": "개발자"}
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads(b"{not json")
@@ -0,0 +1,17 @@
+import pytest
+from conftest import read_fixture
+from markdown_renderer import legacy_render
+from parsing import BACKENDS, parse_html, render_markdown, sanitize_detail
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("name", ["saramin_detail.html", "jobkorea_detail.html"])
+def test_render_markdown_matches_html2text(use_backend, backend, name):
+    use_backend(backend)
+    soup, _, _ = sanitize_detail(parse_html(read_fixture(name), "utf-8"))
+    assert render_markdown(soup) == legacy_render(soup)
+
+
+def test_render_markdown_escapes_like_serialized_html():
+    soup = parse_html("<p>a &amp; b &lt;c&gt;</p><script>if (a < b) {}</script><!-- 주석 --><p>끝</p>", backend="html.parser")
+    assert render_markdown(soup) == legacy_render(soup)
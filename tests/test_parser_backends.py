@@ -0,0 +1,25 @@
+import logging
+import pytest
+from conftest import read_fixture
+from crawler.saramin_crawler import SaraminCrawler
+from crawler.jobkorea_crawler import JobkoreaCrawler
+from parsing import BACKENDS
+
+KEYWORDS = SaraminCrawler(logger=logging.getLogger("Test")).keyword
+
+CASES = {
+    "saramin.detail": lambda: SaraminCrawler.parse_job_detail(read_fixture("saramin_detail.html"), "utf-8", KEYWORDS),
+    "saramin.summary": lambda: SaraminCrawler.parse_job_summary(read_fixture("saramin_summary.json"), "utf-8", 52323189),
+    "saramin.company": lambda: SaraminCrawler.parse_company_info(read_fixture("saramin_company.html"), "utf-8", "https://m.saramin.co.kr/c"),
+    "jobkorea.detail": lambda: JobkoreaCrawler.parse_job_detail(read_fixture("jobkorea_detail.html"), "utf-8", KEYWORDS),
+    "jobkorea.summary": lambda: JobkoreaCrawler.parse_summary_info(read_fixture("jobkorea_summary.html"), "utf-8", "https://m.jobkorea.co.kr"),
+}
+
+
+@pytest.mark.parametrize("backend", [name for name in BACKENDS if name != "html.parser"])
+@pytest.mark.parametrize("case", CASES)
+def test_backend_matches_html_parser(use_backend, backend, case):
+    use_backend("html.parser")
+    expected = CASES[case]()
+    use_backend(backend)
+    assert CASES[case]() == expected
@@ -0,0 +1,55 @@
+import asyncio
+import logging
+import httpx
+from crawler.base_crawler import BaseCrawler
+from crawler.http_client import build_client
+from crawler.retry import RetryExhaustedError, RetryPolicy
+
+
+class FakeCrawler(BaseCrawler):
+    fetch_job_list = fetch_job_detail = fetch_company_info = fetch_job_pages = parse_job_pages = None
+
+
+def run_request(status_code, **kwargs):
+    """항상 status_code로 응답하는 MockTransport로 request를 한 번 돌리고 결과와 시도 횟수를 돌려준다."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(status_code)
+
+    crawler = FakeCrawler("https://example.com", "Test", logging.getLogger("Test"),
+                          retry_policy=RetryPolicy(max_attempts=3, base_delay=0.0))
+    crawler.replay = True
+    crawler.client = build_client(crawler.header, httpx.MockTransport(handler))
+
+    async def main():
+        try:
+            return await crawler.request("GET", "https://example.com/job/1", **kwargs)
+        except RetryExhaustedError as e:
+            return e
+        finally:
+            await crawler.client.aclose()
+
+    return asyncio.run(main()), calls, crawler
+
+
+def test_posting_503_is_gone_without_retry():
+    result, calls, crawler = run_request(503, gone_statuses=RetryPolicy().posting_gone_statuses)
+    assert result is None
+    assert len(calls) == 1
+    assert crawler.breaker.consecutive_failures == 0
+    assert crawler.limiter.stats()["overload"] == 0
+
+
+def test_503_is_retried_by_default():
+    result, calls, _ = run_request(503)
+    assert isinstance(result, RetryExhaustedError)
+    assert len(calls) == 3
+
+
+def test_attempt_timeout_is_capped_by_deadline():
+    timeout = RetryPolicy().attempt_timeout(httpx.Timeout(15.0), remaining=3.0)
+    assert (timeout.connect, timeout.read, timeout.write, timeout.pool) == (3.0, 3.0, 3.0, 3.0)
+    timeout = RetryPolicy().attempt_timeout(httpx.Timeout(15.0), remaining=-1.0)
+    assert timeout.read == 1.0
@@ -0,0 +1,11 @@
+import pytest
+from conftest import read_fixture
+from detail_sanitizer import legacy_sanitize
+from parsing import parse_html, sanitize_detail
+
+
+@pytest.mark.parametrize("name", ["saramin_detail.html", "jobkorea_detail.html"])
+def test_sanitize_matches_legacy(name):
+    old_soup, old_text, old_images = legacy_sanitize(parse_html(read_fixture(name), "utf-8", backend="html.parser"))
+    new_soup, new_text, new_images = sanitize_detail(parse_html(read_fixture(name), "utf-8", backend="html.parser"))
+    assert (new_text, new_images, str(new_soup)) == (old_text, old_images, str(old_soup))
@@ -0,0 +1,38 @@
+from conftest import read_fixture
+from crawler.saramin_crawler import COMPANY_SCHEMA, SUMMARY_SCHEMA
+from parsing import parse_html
+from parsing.schema import Field, LabeledFields, Schema
+from utils import json_codec
+
+
+def extract_per_rule(schema, root):
+    """규칙마다 트리를 따로 훑던 기존 방식"""
+    result = {}
+    for name, rule in schema.rules:
+        if isinstance(rule, LabeledFields):
+            result.update(rule(root))
+        else:
+            result[name] = rule(root)
+    return result
+
+
+def test_summary_schema_matches_per_rule_extraction():
+    html = json_codec.loads(read_fixture("saramin_summary.json"))["returnData"]
+    soup = parse_html(html, backend="html.parser")
+    assert SUMMARY_SCHEMA.extract(soup) == extract_per_rule(SUMMARY_SCHEMA, soup)
+
+
+def test_company_schema_matches_per_rule_extraction():
+    soup = parse_html(read_fixture("saramin_company.html"), "utf-8", backend="html.parser")
+    assert COMPANY_SCHEMA.extract(soup) == extract_per_rule(COMPANY_SCHEMA, soup)
+
+
+def test_first_match_in_document_order_and_defaults():
+    schema = Schema({
+        "title": Field("h1, .title"),
+        "missing": Field("p.none", default="없음"),
+        "whole": Field(extract=lambda element: element.name),
+        "items": LabeledFields("dl", "dt", "dd", {"키": ("key", Field())}),
+    })
+    soup = parse_html("<div><span class='title'>먼저</span><h1>나중</h1><dl><dt>키</dt><dd>값</dd></dl></div>", backend="html.parser")
+    assert schema.extract(soup) == extract_per_rule(schema, soup) == {"title": "먼저", "missing": "없음", "whole": "[document]", "key": "값"}
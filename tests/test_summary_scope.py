@@ -0,0 +1,30 @@
+import pytest
+from conftest import read_fixture
+from crawler.saramin_crawler import SaraminCrawler
+from crawler.jobkorea_crawler import JobkoreaCrawler
+from parsing import scope
+
+CASES = {
+    "saramin.summary": lambda content: SaraminCrawler.parse_job_summary(content, "utf-8", 52323189),
+    "jobkorea.summary": lambda content: JobkoreaCrawler.parse_summary_info(content, "utf-8", "https://m.jobkorea.co.kr"),
+}
+FIXTURES = {
+    "saramin.summary": "saramin_summary.json",
+    "jobkorea.summary": "jobkorea_summary.html",
+}
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_scoped_parsing_matches_full_parsing(monkeypatch, case):
+    content = read_fixture(FIXTURES[case])
+    monkeypatch.setattr(scope, "SCOPED_PARSING", False)
+    full = CASES[case](content)
+    monkeypatch.setattr(scope, "SCOPED_PARSING", True)
+    assert CASES[case](content) == full
+
+
+def test_section_filter_keeps_heading_and_next_sibling():
+    from parsing import parse_html, section_filter
+    markup = "<div><h2>복리후생</h2><div class='freeform'>식대</div><p>버림</p><span class='keep'>유지</span></div>"
+    soup = parse_html(markup, backend="html.parser", parse_only=section_filter([(None, {"class": "keep"})], heading_tags=("h2",)))
+    assert [tag.name for tag in soup.find_all(recursive=False)] == ["h2", "div", "span"]